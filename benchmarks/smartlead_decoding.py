@@ -0,0 +1,128 @@
+"""Compare Smartlead response decoding paths on realistic payload sizes.
+
+    python -m benchmarks.smartlead_decoding
+
+"dict" is the old path (json.loads, then model_validate per item); "json" is
+the current one (TypeAdapter / model_validate_json on the raw bytes).
+"""
+
+import json
+import timeit
+from typing import List
+
+from pydantic import TypeAdapter
+
+from clients.smartlead.schema import (
+    SmartleadCampaign,
+    SmartleadGetCampaignLeadsResponse,
+)
+
+CAMPAIGN_COUNT = 3000
+LEAD_COUNT = 20000
+REPEAT = 5
+
+
+def make_campaigns(count: int) -> bytes:
+    campaigns = [
+        {
+            "id": 100000 + i,
+            "user_id": 21050,
+            "created_at": "2024-05-01T12:00:00.000Z",
+            "updated_at": "2024-06-01T12:00:00.000Z",
+            "status": "ACTIVE" if i % 3 else "PAUSED",
+            "name": f"Campaign {i} - Outbound Q{i % 4 + 1}",
+            "track_settings": ["DONT_TRACK_EMAIL_OPEN", "DONT_TRACK_LINK_CLICK"],
+            "scheduler_cron_value": {
+                "tz": "America/New_York",
+                "days": [1, 2, 3, 4, 5],
+                "endHour": "17:00",
+                "startHour": "09:00",
+            },
+            "min_time_btwn_emails": 10,
+            "max_leads_per_day": 50,
+            "stop_lead_settings": "REPLY_TO_AN_EMAIL",
+            "enable_ai_esp_matching": True,
+            "send_as_plain_text": False,
+            "follow_up_percentage": 40,
+            "unsubscribe_text": "",
+            "parent_campaign_id": None,
+            "client_id": 1234 if i % 2 else None,
+        }
+        for i in range(count)
+    ]
+    return json.dumps(campaigns).encode()
+
+
+def make_leads_page(count: int) -> bytes:
+    leads = [
+        {
+            "campaign_lead_map_id": 5000000 + i,
+            "status": "INPROGRESS",
+            "lead_category_id": i % 7 or None,
+            "created_at": "2024-05-02T08:30:00.000Z",
+            "lead": {
+                "id": 9000000 + i,
+                "first_name": "Jane",
+                "last_name": f"Doe{i}",
+                "email": f"jane.doe{i}@example.com",
+                "phone_number": "+15555550100",
+                "company_name": f"Example {i} LLC",
+                "website": f"example{i}.com",
+                "location": "New York, NY",
+                "custom_fields": {
+                    "title": "VP Sales",
+                    "industry": "Software",
+                    "informalIndustry": "SaaS",
+                    "headcount": "51-200",
+                },
+                "linkedin_profile": f"https://linkedin.com/in/janedoe{i}",
+                "company_url": f"https://example{i}.com",
+                "is_unsubscribed": False,
+            },
+        }
+        for i in range(count)
+    ]
+    return json.dumps(
+        {"total_leads": count, "offset": 0, "limit": count, "data": leads}
+    ).encode()
+
+
+def best_of(fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    campaigns_raw = make_campaigns(CAMPAIGN_COUNT)
+    leads_raw = make_leads_page(LEAD_COUNT)
+    campaigns_adapter = TypeAdapter(List[SmartleadCampaign])
+
+    cases = {
+        f"campaigns x{CAMPAIGN_COUNT}": (
+            lambda: [
+                SmartleadCampaign.model_validate(item)
+                for item in json.loads(campaigns_raw)
+            ],
+            lambda: campaigns_adapter.validate_json(campaigns_raw),
+            len(campaigns_raw),
+        ),
+        f"leads x{LEAD_COUNT}": (
+            lambda: SmartleadGetCampaignLeadsResponse.model_validate(
+                json.loads(leads_raw)
+            ),
+            lambda: SmartleadGetCampaignLeadsResponse.model_validate_json(leads_raw),
+            len(leads_raw),
+        ),
+    }
+
+    print(f"{'payload':<20}{'size':>10}{'dict (s)':>12}{'json (s)':>12}{'speedup':>10}")
+    for name, (dict_path, json_path, size) in cases.items():
+        dict_time = best_of(dict_path)
+        json_time = best_of(json_path)
+        print(
+            f"{name:<20}{size / 1e6:>8.1f}MB{dict_time:>12.3f}{json_time:>12.3f}"
+            f"{dict_time / json_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 import os
-from typing import List, Any, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Optional, Dict, Iterable, Iterator, Literal
 import requests
 
-from ..smartlead.internal.index import query_smartlead_internal_graphql_endpoint
+from ..smartlead.internal.index import execute_graphql_operation
 
 BASE_LEAD_GENERATION_SERVICE_URL = (
     "https://cohesive-lead-generation-hkdjgqbthtgfe6ah.eastus-01.azurewebsites.net/"
@@ -52,91 +53,319 @@ def auto_schedule_restart_lead_generation_jobs(
     )
 
 
-def get_campaign_leads_by_id_with_mapping(
-    *,
-    campaign_id: int,
-    lead_category: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    where_clause = {
-        "email_campaign_id": {"_eq": campaign_id},
-        "user_id": {"_eq": 21050},
-    }
-
-    if lead_category is not None:
-        where_clause["lead_category_id"] = {"_eq": lead_category}
+COHESIVE_LEADS_PAGE_SIZE = int(os.getenv("COHESIVE_LEADS_PAGE_SIZE", "1000"))
+# Emails per `_in` filter; keeps each request body well under payload limits
+COHESIVE_LEADS_EMAIL_CHUNK_SIZE = int(
+    os.getenv("COHESIVE_LEADS_EMAIL_CHUNK_SIZE", "500")
+)
 
-    variables = {
-        "offset": 0,
-        "limit": 10000,
-        "where": where_clause,
-        "campaignId": campaign_id,
+CAMPAIGN_LEADS_WITH_MAPPING_QUERY = """
+query getCampaignLeadsByIdWithMapping(
+  $limit: Int!,
+  $where: email_campaign_leads_mappings_bool_exp!,
+  $campaignId: Int!
+) {
+  email_campaign_leads_mappings(
+    where: $where
+    limit: $limit
+    order_by: {created_at: asc, id: asc}
+  ) {
+    id
+    created_at
+    status
+    current_seq_num
+    email_campaign_seq_id
+    last_sent_time
+    next_timestamp_to_reach
+    email_lead {
+      ...EmailLeadsFragment
     }
-
-    query = """
-    query getCampaignLeadsByIdWithMapping(
-      $offset: Int!,
-      $limit: Int!,
-      $where: email_campaign_leads_mappings_bool_exp!,
-      $campaignId: Int!
-    ) {
-      email_campaign_leads_mappings(
-        where: $where
-        offset: $offset
-        limit: $limit
-        order_by: {created_at: asc, id: asc}
+    linkedin_cookie {
+      token_name
+    }
+    email_account {
+      username
+      mappingExists: email_campaign_account_mappings(
+        where: {email_campaign_id: {_eq: $campaignId}}
+        limit: 1
       ) {
         id
-        status
-        current_seq_num
-        email_campaign_seq_id
-        last_sent_time
-        next_timestamp_to_reach
-        email_lead {
-          ...EmailLeadsFragment
-        }
-        linkedin_cookie {
-          token_name
-        }
-        email_account {
-          username
-          mappingExists: email_campaign_account_mappings(
-            where: {email_campaign_id: {_eq: $campaignId}}
-            limit: 1
-          ) {
-            id
-          }
-        }
       }
     }
+  }
+}
+
+fragment EmailLeadsFragment on email_leads {
+  id
+  email
+  last_name
+  first_name
+  phone_number
+  company_name
+  website
+  company_url
+  location
+  custom_fields
+  linkedin_profile
+  esp_domain_type
+  seg_type
+}
+"""
+
 
-    fragment EmailLeadsFragment on email_leads {
+# Minimal selections for callers that do not need the full lead record. Both
+# keep `id` and `created_at`, which keyset pagination needs, and skip the
+# per-row `email_account.mappingExists` subquery.
+CAMPAIGN_LEAD_IDS_WITH_MAPPING_QUERY = """
+query getCampaignLeadIdsByIdWithMapping(
+  $limit: Int!,
+  $where: email_campaign_leads_mappings_bool_exp!
+) {
+  email_campaign_leads_mappings(
+    where: $where
+    limit: $limit
+    order_by: {created_at: asc, id: asc}
+  ) {
+    id
+    created_at
+    email_lead {
+      id
+      email
+    }
+  }
+}
+"""
+
+CAMPAIGN_LEAD_CONTACTS_WITH_MAPPING_QUERY = """
+query getCampaignLeadContactsByIdWithMapping(
+  $limit: Int!,
+  $where: email_campaign_leads_mappings_bool_exp!
+) {
+  email_campaign_leads_mappings(
+    where: $where
+    limit: $limit
+    order_by: {created_at: asc, id: asc}
+  ) {
+    id
+    created_at
+    status
+    last_sent_time
+    email_lead {
       id
       email
-      last_name
       first_name
-      phone_number
+      last_name
       company_name
       website
-      company_url
-      location
-      custom_fields
       linkedin_profile
-      esp_domain_type
-      seg_type
     }
-    """
+  }
+}
+"""
 
-    response = query_smartlead_internal_graphql_endpoint(
-        method="POST",
-        body={
-            "query": query,
-            "variables": variables,
-            "operation_name": "getCampaignLeadsByIdWithMapping",
-        },
-    )
+LeadMappingProjection = Literal["ids_only", "contact", "full"]
+
+# projection -> (operation name, document)
+_LEAD_MAPPING_QUERIES = {
+    "ids_only": (
+        "getCampaignLeadIdsByIdWithMapping",
+        CAMPAIGN_LEAD_IDS_WITH_MAPPING_QUERY,
+    ),
+    "contact": (
+        "getCampaignLeadContactsByIdWithMapping",
+        CAMPAIGN_LEAD_CONTACTS_WITH_MAPPING_QUERY,
+    ),
+    "full": ("getCampaignLeadsByIdWithMapping", CAMPAIGN_LEADS_WITH_MAPPING_QUERY),
+}
+
+
+def _campaign_leads_where_clause(
+    campaign_id: int,
+    lead_category: Optional[int],
+    emails: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    where_clause = {
+        "email_campaign_id": {"_eq": campaign_id},
+        "user_id": {"_eq": 21050},
+    }
+
+    if lead_category is not None:
+        where_clause["lead_category_id"] = {"_eq": lead_category}
+
+    if emails is not None:
+        where_clause["email_lead"] = {"email": {"_in": emails}}
+
+    return where_clause
+
+
+def _after_cursor(
+    where_clause: Dict[str, Any], last_row: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Restrict `where_clause` to rows after `last_row` in (created_at, id) order."""
+    created_at = last_row["created_at"]
+    return {
+        "_and": [
+            where_clause,
+            {
+                "_or": [
+                    {"created_at": {"_gt": created_at}},
+                    {"created_at": {"_eq": created_at}, "id": {"_gt": last_row["id"]}},
+                ]
+            },
+        ]
+    }
+
+
+def _fetch_campaign_leads_page(
+    *,
+    campaign_id: int,
+    where_clause: Dict[str, Any],
+    limit: int,
+    projection: LeadMappingProjection = "full",
+) -> List[Dict[str, Any]]:
+    try:
+        operation_name, query = _LEAD_MAPPING_QUERIES[projection]
+    except KeyError:
+        raise ValueError(f"Unknown lead mapping projection: {projection}") from None
+
+    variables = {"limit": limit, "where": where_clause}
+    if projection == "full":
+        variables["campaignId"] = campaign_id
+
+    response = execute_graphql_operation(operation_name, query, variables)
 
     # Optional schema parsing / validation hook
     if "errors" in response:
         raise RuntimeError(response["errors"])
 
     return response["data"]["email_campaign_leads_mappings"]
+
+
+def iter_campaign_leads_by_id_with_mapping_pages(
+    *,
+    campaign_id: int,
+    lead_category: Optional[int] = None,
+    page_size: int = COHESIVE_LEADS_PAGE_SIZE,
+    prefetch: bool = False,
+    emails: Optional[List[str]] = None,
+    projection: LeadMappingProjection = "full",
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield a campaign's lead mappings page by page in (created_at, id) order.
+
+    Pages are keyset-paginated: each request asks for rows after the last one
+    seen, so there is no offset limit and rows added mid-scan are not skipped
+    or repeated. Each page depends on the previous one, so pages cannot be
+    fetched in parallel; with `prefetch=True` the next page is requested in
+    the background while the caller works on the current one. `emails`
+    restricts the scan server-side to leads with one of those addresses.
+
+    `projection` picks the fields returned per row: "ids_only" (mapping id
+    and email_lead id/email), "contact" (adds status and basic contact
+    fields) or "full" (every field, including the per-row account subquery).
+    """
+    base_where = _campaign_leads_where_clause(campaign_id, lead_category, emails)
+
+    def fetch(where_clause: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _fetch_campaign_leads_page(
+            campaign_id=campaign_id,
+            where_clause=where_clause,
+            limit=page_size,
+            projection=projection,
+        )
+
+    if not prefetch:
+        page = fetch(base_where)
+        while page:
+            yield page
+            if len(page) < page_size:
+                return
+            page = fetch(_after_cursor(base_where, page[-1]))
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch, base_where)
+        while True:
+            page = future.result()
+            if not page:
+                return
+            if len(page) == page_size:
+                future = executor.submit(fetch, _after_cursor(base_where, page[-1]))
+            yield page
+            if len(page) < page_size:
+                return
+
+
+def iter_campaign_leads_by_id_with_mapping(
+    *,
+    campaign_id: int,
+    lead_category: Optional[int] = None,
+    page_size: int = COHESIVE_LEADS_PAGE_SIZE,
+    prefetch: bool = False,
+    projection: LeadMappingProjection = "full",
+) -> Iterator[Dict[str, Any]]:
+    for page in iter_campaign_leads_by_id_with_mapping_pages(
+        campaign_id=campaign_id,
+        lead_category=lead_category,
+        page_size=page_size,
+        prefetch=prefetch,
+        projection=projection,
+    ):
+        yield from page
+
+
+def get_campaign_leads_by_id_with_mapping(
+    *,
+    campaign_id: int,
+    lead_category: Optional[int] = None,
+    projection: LeadMappingProjection = "full",
+) -> List[Dict[str, Any]]:
+    return list(
+        iter_campaign_leads_by_id_with_mapping(
+            campaign_id=campaign_id,
+            lead_category=lead_category,
+            prefetch=True,
+            projection=projection,
+        )
+    )
+
+
+def iter_campaign_leads_by_emails_with_mapping(
+    *,
+    campaign_id: int,
+    emails: Iterable[str],
+    lead_category: Optional[int] = None,
+    chunk_size: int = COHESIVE_LEADS_EMAIL_CHUNK_SIZE,
+    projection: LeadMappingProjection = "full",
+) -> Iterator[Dict[str, Any]]:
+    """Yield only the lead mappings whose email is in `emails`.
+
+    The filter runs server-side (`email_lead.email _in [...]`), one request
+    chain per chunk of emails, so only matching rows are transferred. Matching
+    is exact, like the email comparison in Smartlead itself.
+    """
+    unique_emails = list(dict.fromkeys(email for email in emails if email))
+    for start in range(0, len(unique_emails), chunk_size):
+        for page in iter_campaign_leads_by_id_with_mapping_pages(
+            campaign_id=campaign_id,
+            lead_category=lead_category,
+            emails=unique_emails[start : start + chunk_size],
+            projection=projection,
+        ):
+            yield from page
+
+
+def get_campaign_leads_by_emails_with_mapping(
+    *,
+    campaign_id: int,
+    emails: Iterable[str],
+    lead_category: Optional[int] = None,
+    projection: LeadMappingProjection = "full",
+) -> List[Dict[str, Any]]:
+    return list(
+        iter_campaign_leads_by_emails_with_mapping(
+            campaign_id=campaign_id,
+            emails=emails,
+            lead_category=lead_category,
+            projection=projection,
+        )
+    )
@@ -0,0 +1,103 @@
+import json
+import os
+import time
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from clients.smartlead.index import get_campaign_top_level_analytics_for_date_range
+from clients.smartlead.local_store import connect
+
+
+# Timezone Smartlead uses for date-range analytics; day boundaries follow it.
+SMARTLEAD_ANALYTICS_TIMEZONE = os.getenv("SMARTLEAD_ANALYTICS_TIMEZONE", "UTC")
+# A window counts as final only if fetched this long after its last day ended
+# (in SMARTLEAD_ANALYTICS_TIMEZONE), leaving room for late events.
+SMARTLEAD_ANALYTICS_SETTLE_SECONDS = float(
+    os.getenv("SMARTLEAD_ANALYTICS_SETTLE_SECONDS", "3600")
+)
+# How long a window that is still open (ends today or later) is reused.
+SMARTLEAD_ANALYTICS_CACHE_TTL_SECONDS = float(
+    os.getenv("SMARTLEAD_ANALYTICS_CACHE_TTL_SECONDS", "900")
+)
+
+
+def _ensure_table(conn) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS campaign_range_analytics (
+            campaign_id TEXT NOT NULL,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (campaign_id, start_date, end_date)
+        )
+        """
+    )
+
+
+def _load_cached_range(
+    campaign_id: str, start_date: str, end_date: str
+) -> Optional[Tuple[Dict[str, Any], float]]:
+    with closing(connect()) as conn, conn:
+        _ensure_table(conn)
+        row = conn.execute(
+            "SELECT payload, fetched_at FROM campaign_range_analytics"
+            " WHERE campaign_id = ? AND start_date = ? AND end_date = ?",
+            (campaign_id, start_date, end_date),
+        ).fetchone()
+    return (json.loads(row[0]), row[1]) if row else None
+
+
+def _store_range(
+    campaign_id: str, start_date: str, end_date: str, payload: Dict[str, Any]
+) -> None:
+    with closing(connect()) as conn, conn:
+        _ensure_table(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO campaign_range_analytics"
+            " (campaign_id, start_date, end_date, payload, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (campaign_id, start_date, end_date, json.dumps(payload), time.time()),
+        )
+
+
+def _settles_at(end_date: str) -> float:
+    """Timestamp after which analytics ending on `end_date` no longer change."""
+    day_end = datetime.combine(
+        date.fromisoformat(end_date) + timedelta(days=1),
+        datetime.min.time(),
+        tzinfo=ZoneInfo(SMARTLEAD_ANALYTICS_TIMEZONE),
+    )
+    return day_end.timestamp() + SMARTLEAD_ANALYTICS_SETTLE_SECONDS
+
+
+def _is_fresh(end_date: str, fetched_at: float) -> bool:
+    if fetched_at >= _settles_at(end_date):
+        return True
+    return time.time() - fetched_at < SMARTLEAD_ANALYTICS_CACHE_TTL_SECONDS
+
+
+def get_campaign_analytics_for_date_range_cached(
+    campaign_id: str, start_date: str, end_date: str
+) -> Dict[str, Any]:
+    """Date-range analytics from the local store, fetched with one ranged call.
+
+    A window fetched after its last day settled (end of day in
+    SMARTLEAD_ANALYTICS_TIMEZONE plus SMARTLEAD_ANALYTICS_SETTLE_SECONDS) is
+    final and kept; a window that may still change is reused for
+    SMARTLEAD_ANALYTICS_CACHE_TTL_SECONDS. Counts come from Smartlead as-is,
+    so unique counts stay correct. Never costs more than the uncached call.
+    """
+    campaign_id = str(campaign_id)
+    cached = _load_cached_range(campaign_id, start_date, end_date)
+    if cached is not None and _is_fresh(end_date, cached[1]):
+        return cached[0]
+
+    payload = get_campaign_top_level_analytics_for_date_range(
+        campaign_id, start_date=start_date, end_date=end_date
+    )
+    _store_range(campaign_id, start_date, end_date, payload)
+    return payload
@@ -0,0 +1,292 @@
+import asyncio
+import logging
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+import streamlit as st
+from pydantic import TypeAdapter, ValidationError
+
+from clients.smartlead.cache import invalidate_sequences
+from clients.smartlead.index import SMARTLEAD_API, SMARTLEAD_PAGE_MAX_RETRIES
+from clients.smartlead.rate_limit import send_with_rate_limit_async
+from clients.smartlead.schema import (
+    SmartleadCampaign,
+    SmartleadCampaignLead,
+    SmartleadCampaignSequence,
+    SmartleadCampaignSequenceInput,
+    SmartleadCampaignStatistics,
+    SmartleadGetCampaignLeadsResponse,
+)
+from clients.smartlead.transport import build_async_http_client, smartlead_error
+
+_CAMPAIGNS_ADAPTER = TypeAdapter(List[SmartleadCampaign])
+_SEQUENCES_ADAPTER = TypeAdapter(List[SmartleadCampaignSequence])
+
+
+class AsyncSmartleadClient:
+    """Async mirror of clients/smartlead/index.py on top of httpx.AsyncClient.
+
+    Requests share the process-wide rate limiter with the sync helpers, so
+    fanning out with asyncio.gather stays under the Smartlead ceiling:
+
+        async with AsyncSmartleadClient() as client:
+            campaigns = await asyncio.gather(
+                *(client.get_campaign_by_id(cid) for cid in campaign_ids)
+            )
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self._api_key = api_key or st.secrets["SMARTLEAD_API_KEY"]
+        self._http_client = http_client or build_async_http_client()
+
+    async def __aenter__(self) -> "AsyncSmartleadClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http_client.aclose()
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Any] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        url = f"{SMARTLEAD_API}{endpoint}"
+        params = dict(query_params or {})
+        params["api_key"] = self._api_key
+
+        try:
+            response = await send_with_rate_limit_async(
+                lambda: self._http_client.request(
+                    method=method.upper(),
+                    url=url,
+                    headers=headers,
+                    json=body,
+                    params=params,
+                )
+            )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            raise smartlead_error(endpoint, e) from e
+
+    async def query(
+        self,
+        endpoint: str,
+        method: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Any] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        response = await self._request(
+            endpoint, method, headers=headers, body=body, query_params=query_params
+        )
+        return response.json()
+
+    async def query_raw(
+        self,
+        endpoint: str,
+        method: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Any] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        response = await self._request(
+            endpoint, method, headers=headers, body=body, query_params=query_params
+        )
+        return response.content
+
+    async def get_campaigns(self) -> List[SmartleadCampaign]:
+        raw = await self.query_raw("/campaigns", method="GET")
+
+        try:
+            return _CAMPAIGNS_ADAPTER.validate_json(raw)
+        except ValidationError as e:
+            raise RuntimeError(
+                f"Smartlead campaign schema validation failed:\n{e}"
+            ) from e
+
+    async def get_campaign_by_id(self, campaign_id: int) -> SmartleadCampaign:
+        raw = await self.query_raw(endpoint=f"campaigns/{campaign_id}", method="GET")
+        try:
+            return SmartleadCampaign.model_validate_json(raw)
+        except Exception as e:
+            raise ValueError(
+                f"Invalid campaign data from Smartlead API for ID {campaign_id}: {e}"
+            ) from e
+
+    async def get_campaign_statistics(
+        self, campaign_id: str
+    ) -> SmartleadCampaignStatistics:
+        try:
+            raw = await self.query_raw(
+                f"/campaigns/{campaign_id}/analytics", method="GET"
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to get campaign statistics for campaign {campaign_id}: {e}"
+            ) from e
+
+        try:
+            return SmartleadCampaignStatistics.model_validate_json(raw, strict=False)
+        except ValidationError as e:
+            raise RuntimeError(
+                f"Smartlead campaign statistics schema validation failed for {campaign_id}:\n{e}"
+            ) from e
+
+    async def get_campaign_sequences(
+        self, campaign_id: int
+    ) -> List[SmartleadCampaignSequence]:
+        raw = await self.query_raw(
+            endpoint=f"/campaigns/{campaign_id}/sequences",
+            method="GET",
+        )
+
+        try:
+            return _SEQUENCES_ADAPTER.validate_json(raw)
+        except ValidationError as e:
+            raise RuntimeError(
+                f"Smartlead campaign sequences schema validation failed for campaign {campaign_id}:\n{e}"
+            ) from e
+
+    async def add_sequences_to_campaign(
+        self,
+        *,
+        campaign_id: int,
+        input_sequences: List[SmartleadCampaignSequenceInput],
+    ) -> None:
+        try:
+            sequences_payload = [
+                seq.model_dump(by_alias=True, exclude_none=True)
+                for seq in input_sequences
+            ]
+        except ValidationError as e:
+            raise RuntimeError(f"Sequence input validation failed: {e}") from e
+
+        try:
+            await self.query(
+                endpoint=f"/campaigns/{int(campaign_id)}/sequences",
+                method="POST",
+                body={"sequences": sequences_payload},
+            )
+        except Exception as e:
+            msg = getattr(e, "message", str(e))
+            raise RuntimeError(
+                f"Error adding sequences to campaign {campaign_id}: {msg}"
+            ) from e
+        finally:
+            invalidate_sequences(campaign_id)
+
+    async def _fetch_leads_page(
+        self,
+        campaign_id: int,
+        params: Dict[str, Any],
+        offset: int,
+        max_retries: int = SMARTLEAD_PAGE_MAX_RETRIES,
+    ) -> SmartleadGetCampaignLeadsResponse:
+        """Fetch one lead page, retrying failures up to `max_retries` times."""
+        for attempt in range(max_retries + 1):
+            try:
+                raw = await self.query_raw(
+                    endpoint=f"campaigns/{campaign_id}/leads",
+                    method="GET",
+                    query_params={**params, "offset": offset},
+                )
+                return SmartleadGetCampaignLeadsResponse.model_validate_json(raw)
+            except Exception as e:
+                logging.error(
+                    f"Error getting leads for campaign {campaign_id} "
+                    f"at offset {offset} (attempt {attempt + 1}/{max_retries + 1}): {e}"
+                )
+                if attempt == max_retries:
+                    raise RuntimeError(
+                        f"Giving up on leads for campaign {campaign_id} "
+                        f"at offset {offset}: {e}"
+                    ) from e
+                await asyncio.sleep(min(2**attempt, 30))
+
+    async def iter_campaign_lead_pages(
+        self,
+        campaign_id: int,
+        lead_category_id: Optional[int] = None,
+        event_time: Optional[str] = None,
+        concurrency: int = 5,
+        max_page_retries: int = SMARTLEAD_PAGE_MAX_RETRIES,
+    ) -> AsyncIterator[SmartleadGetCampaignLeadsResponse]:
+        """Yield lead pages in offset order with up to `concurrency` in flight.
+
+        A page that still fails after `max_page_retries` retries raises,
+        including the first one, same as the sync client.
+        """
+        params = {}
+        if event_time:
+            params["event_time_gt"] = event_time
+        if lead_category_id:
+            params["lead_category_id"] = lead_category_id
+
+        first_page = await self._fetch_leads_page(
+            campaign_id, params, 0, max_page_retries
+        )
+        yield first_page
+        step = first_page.limit or len(first_page.data)
+        if not step:
+            return
+
+        async def fetch(offset: int) -> SmartleadGetCampaignLeadsResponse:
+            return await self._fetch_leads_page(
+                campaign_id, params, offset, max_page_retries
+            )
+
+        offsets = iter(range(len(first_page.data), first_page.total_leads, step))
+        pending = deque(
+            asyncio.create_task(fetch(offset))
+            for offset in islice(offsets, max(1, concurrency))
+        )
+        try:
+            while pending:
+                page = await pending.popleft()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(asyncio.create_task(fetch(next_offset)))
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_leads_by_campaign_id_with_pagination(
+        self,
+        campaign_id: int,
+        lead_category_id: Optional[int] = None,
+        event_time: Optional[str] = None,
+        concurrency: int = 5,
+    ) -> List[SmartleadCampaignLead]:
+        """List a campaign's leads; returns [] if the first page cannot be fetched."""
+        pages = self.iter_campaign_lead_pages(
+            campaign_id,
+            lead_category_id=lead_category_id,
+            event_time=event_time,
+            concurrency=concurrency,
+        )
+        try:
+            first_page = await pages.__anext__()
+        except StopAsyncIteration:
+            return []
+        except Exception as e:
+            logging.error(f"Error fetching first page: {e}")
+            return []
+
+        leads: List[SmartleadCampaignLead] = list(first_page.data)
+        async for page in pages:
+            leads.extend(page.data)
+        return leads
@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from clients.smartlead.index import add_sequences_to_campaign, get_campaign_sequences
+from clients.smartlead.schema import (
+    SmartleadBulkSequenceWriteResult,
+    SmartleadCampaignSequence,
+    SmartleadCampaignSequenceInput,
+)
+
+
+SMARTLEAD_BULK_MAX_WORKERS = int(os.getenv("SMARTLEAD_BULK_MAX_WORKERS", "8"))
+
+# Receives the campaign ID and its current sequences; returns the sequences to
+# write, or None to leave the campaign untouched.
+SequenceBuilder = Callable[
+    [int, List[SmartleadCampaignSequence]],
+    Optional[List[SmartleadCampaignSequenceInput]],
+]
+
+
+def _write_campaign_sequences(
+    campaign_id: int, build_sequences: SequenceBuilder
+) -> SmartleadBulkSequenceWriteResult:
+    try:
+        current = get_campaign_sequences(campaign_id, use_cache=False)
+        input_sequences = build_sequences(campaign_id, current)
+        if input_sequences is None:
+            return SmartleadBulkSequenceWriteResult(campaign_id=campaign_id, ok=True)
+        diff = add_sequences_to_campaign(
+            campaign_id=campaign_id, input_sequences=input_sequences
+        )
+    except Exception as e:
+        return SmartleadBulkSequenceWriteResult(
+            campaign_id=campaign_id,
+            ok=False,
+            error=getattr(e, "message", str(e)) or type(e).__name__,
+        )
+    return SmartleadBulkSequenceWriteResult(campaign_id=campaign_id, ok=True, diff=diff)
+
+
+def iter_bulk_sequence_writes(
+    campaign_ids: Iterable[int],
+    build_sequences: SequenceBuilder,
+    max_workers: int = SMARTLEAD_BULK_MAX_WORKERS,
+) -> Iterator[SmartleadBulkSequenceWriteResult]:
+    """Rewrite the sequences of many campaigns concurrently.
+
+    Each campaign is read fresh, passed through `build_sequences` and written
+    back (skipping no-op writes). Requests share the client-wide rate limit.
+    Results are yielded as campaigns finish, not in input order; a failing
+    campaign yields `ok=False` instead of raising. `build_sequences` runs on
+    worker threads, so it must not touch Streamlit.
+    """
+    unique_ids = list(dict.fromkeys(int(campaign_id) for campaign_id in campaign_ids))
+    if not unique_ids:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        futures = [
+            executor.submit(_write_campaign_sequences, campaign_id, build_sequences)
+            for campaign_id in unique_ids
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,84 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from cachetools import TTLCache
+
+
+SMARTLEAD_CACHE_TTL_SECONDS = float(os.getenv("SMARTLEAD_CACHE_TTL_SECONDS", "300"))
+SMARTLEAD_CACHE_MAX_ENTRIES = int(os.getenv("SMARTLEAD_CACHE_MAX_ENTRIES", "1024"))
+
+
+class MetadataCache:
+    """Thread-safe TTL + LRU cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], refresh: bool = False
+    ) -> Any:
+        """Return the cached value, or call `loader` and cache its result.
+
+        `refresh=True` skips the lookup and replaces the entry with a fresh load.
+        """
+        with self._lock:
+            if not refresh and key in self._cache:
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._cache[key] = value
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+
+_metadata_cache = MetadataCache(SMARTLEAD_CACHE_MAX_ENTRIES, SMARTLEAD_CACHE_TTL_SECONDS)
+
+
+def get_metadata_cache() -> MetadataCache:
+    return _metadata_cache
+
+
+def campaigns_key() -> tuple:
+    return ("campaigns",)
+
+
+def campaign_summaries_key() -> tuple:
+    return ("campaign_summaries",)
+
+
+def campaign_key(campaign_id: int) -> tuple:
+    return ("campaign", int(campaign_id))
+
+
+def sequences_key(campaign_id: int) -> tuple:
+    return ("sequences", int(campaign_id))
+
+
+def invalidate_campaign(campaign_id: int) -> None:
+    """Drop a campaign's metadata, including its row in the campaign list."""
+    _metadata_cache.invalidate(
+        campaigns_key(), campaign_summaries_key(), campaign_key(campaign_id)
+    )
+
+
+def invalidate_sequences(campaign_id: int) -> None:
+    _metadata_cache.invalidate(sequences_key(campaign_id))
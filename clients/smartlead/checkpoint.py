@@ -0,0 +1,76 @@
+import os
+import time
+from contextlib import closing
+from typing import Any, Dict, Set
+
+from clients.smartlead.local_store import connect
+from common.single_flight import request_key
+
+
+# Roughly one long fetch: a checkpoint only bridges retries and restarts of the
+# same run, since leads added or removed later shift every offset.
+SMARTLEAD_CHECKPOINT_MAX_AGE_SECONDS = float(
+    os.getenv("SMARTLEAD_CHECKPOINT_MAX_AGE_SECONDS", str(60 * 60))
+)
+
+
+class LeadPaginationCheckpoint:
+    """Completed lead pages of one (campaign, filter) fetch, persisted locally.
+
+    Pages are stored as the raw response body keyed by offset, so a restarted
+    fetch can replay them without hitting Smartlead again. Checkpoints older
+    than SMARTLEAD_CHECKPOINT_MAX_AGE_SECONDS are discarded.
+    """
+
+    def __init__(self, campaign_id: int, params: Dict[str, Any]):
+        self.fetch_key = request_key(int(campaign_id), params)
+        with closing(connect()) as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS lead_page_checkpoints (
+                    fetch_key TEXT NOT NULL,
+                    page_offset INTEGER NOT NULL,
+                    page BLOB NOT NULL,
+                    saved_at REAL NOT NULL,
+                    PRIMARY KEY (fetch_key, page_offset)
+                )
+                """
+            )
+            conn.execute(
+                "DELETE FROM lead_page_checkpoints WHERE saved_at < ?",
+                (time.time() - SMARTLEAD_CHECKPOINT_MAX_AGE_SECONDS,),
+            )
+
+    def completed_offsets(self) -> Set[int]:
+        with closing(connect()) as conn:
+            rows = conn.execute(
+                "SELECT page_offset FROM lead_page_checkpoints WHERE fetch_key = ?",
+                (self.fetch_key,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def load_page(self, offset: int) -> bytes:
+        with closing(connect()) as conn:
+            row = conn.execute(
+                "SELECT page FROM lead_page_checkpoints"
+                " WHERE fetch_key = ? AND page_offset = ?",
+                (self.fetch_key, offset),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No checkpointed page at offset {offset}")
+        return bytes(row[0])
+
+    def save_page(self, offset: int, page: bytes) -> None:
+        with closing(connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO lead_page_checkpoints"
+                " (fetch_key, page_offset, page, saved_at) VALUES (?, ?, ?, ?)",
+                (self.fetch_key, offset, page, time.time()),
+            )
+
+    def clear(self) -> None:
+        with closing(connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM lead_page_checkpoints WHERE fetch_key = ?",
+                (self.fetch_key,),
+            )
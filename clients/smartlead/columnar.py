@@ -0,0 +1,125 @@
+import json
+from typing import Any, Dict, Iterable, List, Literal, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from clients.smartlead.index import iter_raw_campaign_lead_pages
+
+
+LEAD_STRING_FIELDS = [
+    "first_name",
+    "last_name",
+    "email",
+    "phone_number",
+    "company_name",
+    "website",
+    "location",
+    "linkedin_profile",
+    "company_url",
+]
+
+LEADS_SCHEMA = pa.schema(
+    [
+        ("campaign_lead_map_id", pa.int64()),
+        ("status", pa.string()),
+        ("lead_category_id", pa.int64()),
+        # Microsecond precision so sub-millisecond timestamps parse losslessly
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("lead_id", pa.int64()),
+        *[(field, pa.string()) for field in LEAD_STRING_FIELDS],
+        ("is_unsubscribed", pa.bool_()),
+        # Free-form per-lead data, kept as a JSON document per row
+        ("custom_fields", pa.string()),
+    ]
+)
+
+
+def leads_rows_to_table(rows: List[Dict[str, Any]]) -> pa.Table:
+    """Convert raw /campaigns/{id}/leads rows into a typed Arrow table."""
+    columns: Dict[str, list] = {name: [] for name in LEADS_SCHEMA.names}
+    for row in rows:
+        lead = row.get("lead") or {}
+        columns["campaign_lead_map_id"].append(row.get("campaign_lead_map_id"))
+        columns["status"].append(row.get("status"))
+        columns["lead_category_id"].append(row.get("lead_category_id"))
+        columns["created_at"].append(row.get("created_at"))
+        columns["lead_id"].append(lead.get("id"))
+        for field in LEAD_STRING_FIELDS:
+            columns[field].append(lead.get(field))
+        columns["is_unsubscribed"].append(lead.get("is_unsubscribed"))
+        custom_fields = lead.get("custom_fields")
+        columns["custom_fields"].append(
+            json.dumps(custom_fields) if custom_fields is not None else None
+        )
+
+    arrays = []
+    for field in LEADS_SCHEMA:
+        if field.name == "created_at":
+            # ISO-8601 strings; Arrow parses them during the cast
+            arrays.append(
+                pa.array(columns[field.name], type=pa.string()).cast(field.type)
+            )
+        else:
+            arrays.append(pa.array(columns[field.name], type=field.type))
+    return pa.Table.from_arrays(arrays, schema=LEADS_SCHEMA)
+
+
+def get_campaign_leads_table(
+    campaign_id: int,
+    lead_category_id: Optional[int] = None,
+    event_time: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> pa.Table:
+    """Fetch a campaign's leads straight into one Arrow table.
+
+    Pages are converted as they arrive, so no per-lead pydantic objects are
+    built and only one page of Python dicts is alive at a time.
+    """
+    tables = [
+        leads_rows_to_table(page.data)
+        for page in iter_raw_campaign_lead_pages(
+            campaign_id,
+            lead_category_id=lead_category_id,
+            event_time=event_time,
+            max_workers=max_workers,
+        )
+    ]
+    if not tables:
+        return LEADS_SCHEMA.empty_table()
+    return pa.concat_tables(tables).combine_chunks()
+
+
+def filter_leads_table(
+    table: pa.Table,
+    emails: Optional[Iterable[str]] = None,
+    lead_category_ids: Optional[Iterable[int]] = None,
+) -> pa.Table:
+    """Keep rows matching any of `emails` (case-insensitive) and categories."""
+    mask = None
+    if emails is not None:
+        wanted = pa.array(
+            {email.strip().lower() for email in emails if email}, pa.string()
+        )
+        mask = pc.is_in(pc.utf8_lower(table["email"]), value_set=wanted)
+    if lead_category_ids is not None:
+        wanted_ids = pa.array(set(lead_category_ids), pa.int64())
+        category_mask = pc.is_in(table["lead_category_id"], value_set=wanted_ids)
+        mask = category_mask if mask is None else pc.and_(mask, category_mask)
+    if mask is None:
+        return table
+    return table.filter(mask)
+
+
+def write_leads_table(
+    table: pa.Table, sink: Any, format: Literal["parquet", "tsv"] = "parquet"
+) -> None:
+    """Write a leads table to a path or file-like object without a pandas copy."""
+    if format == "parquet":
+        pq.write_table(table, sink)
+    elif format == "tsv":
+        pa_csv.write_csv(table, sink, write_options=pa_csv.WriteOptions(delimiter="\t"))
+    else:
+        raise ValueError(f"Unsupported leads export format: {format}")
@@ -1,58 +1,119 @@
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Tuple, TypeVar
 import logging
-import requests
+import os
+import time
+import httpx
 import streamlit as st
 from typing import Optional, Dict, Any
-from pydantic import ValidationError
-import time
+from pydantic import TypeAdapter, ValidationError
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from clients.smartlead.schema import (
+    CampaignSummary,
     SmartleadCampaign,
     SmartleadCampaignLead,
     SmartleadCampaignSequence,
     SmartleadCampaignSequenceInput,
     SmartleadCampaignStatistics,
     SmartleadGetCampaignLeadsResponse,
+    SmartleadRawLeadsPage,
+    SmartleadSequenceDiff,
 )
+from clients.smartlead.cache import (
+    campaign_key,
+    campaign_summaries_key,
+    campaigns_key,
+    get_metadata_cache,
+    invalidate_sequences,
+    sequences_key,
+)
+from clients.smartlead.checkpoint import LeadPaginationCheckpoint
+from clients.smartlead.rate_limit import send_with_rate_limit
+from clients.smartlead.sequence_diff import diff_sequences
+from clients.smartlead.transport import get_http_client, smartlead_error
+from common.single_flight import SingleFlight, request_key
 
 
 SMARTLEAD_API = "https://server.smartlead.ai/api/v1/"
+SMARTLEAD_PAGE_MAX_RETRIES = int(os.getenv("SMARTLEAD_PAGE_MAX_RETRIES", "3"))
 
+PageT = TypeVar("PageT")
 
-def query_smartlead(
+
+_in_flight = SingleFlight()
+
+_CAMPAIGNS_ADAPTER = TypeAdapter(List[SmartleadCampaign])
+_CAMPAIGN_SUMMARIES_ADAPTER = TypeAdapter(List[CampaignSummary])
+_SEQUENCES_ADAPTER = TypeAdapter(List[SmartleadCampaignSequence])
+
+
+def _request_smartlead(
     endpoint: str,
     method: str,
     headers: Optional[Dict[str, str]] = None,
     body: Optional[Any] = None,
     query_params: Optional[Dict[str, Any]] = None,
-) -> Any:
+) -> httpx.Response:
     url = f"{SMARTLEAD_API}{endpoint}"
-    params = query_params or {}
+    params = dict(query_params or {})
     params["api_key"] = st.secrets["SMARTLEAD_API_KEY"]
 
-    try:
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            json=body,
-            params=params,
-            timeout=30,
+    def send() -> httpx.Response:
+        return send_with_rate_limit(
+            lambda: get_http_client().request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                json=body,
+                params=params,
+            )
         )
+
+    try:
+        # Identical concurrent reads (e.g. every session loading the campaign
+        # list at once) share a single upstream call; each caller decodes its
+        # own copy of the body.
+        if method.upper() == "GET":
+            response = _in_flight.do(
+                request_key(method.upper(), url, params, headers), send
+            )
+        else:
+            response = send()
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
-        try:
-            error_data = response.json()
-            error_msg = error_data.get("error", str(e))
-            detailed_msg = error_data.get("message", "")
-        except ValueError:
-            error_msg = str(e)
-            detailed_msg = ""
-        raise Exception(
-            f"Email Server Error with {endpoint} - {error_msg} : {detailed_msg}"
-        ) from e
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Email Server Error with {endpoint} - {str(e)}") from e
+        return response
+    except httpx.HTTPError as e:
+        raise smartlead_error(endpoint, e) from e
+
+
+def query_smartlead(
+    endpoint: str,
+    method: str,
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[Any] = None,
+    query_params: Optional[Dict[str, Any]] = None,
+) -> Any:
+    return _request_smartlead(
+        endpoint, method, headers=headers, body=body, query_params=query_params
+    ).json()
+
+
+def query_smartlead_raw(
+    endpoint: str,
+    method: str,
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[Any] = None,
+    query_params: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """Same as query_smartlead, but returns the undecoded body.
+
+    Pair it with `Model.model_validate_json` / `TypeAdapter.validate_json` so
+    the payload is parsed straight into schema models without building an
+    intermediate dict tree.
+    """
+    return _request_smartlead(
+        endpoint, method, headers=headers, body=body, query_params=query_params
+    ).content
 
 
 def get_campaign_top_level_analytics_for_date_range(
@@ -67,10 +128,20 @@ def get_campaign_top_level_analytics_for_date_range(
     return response
 
 
-def get_campaign_by_id(campaign_id: int) -> SmartleadCampaign:
-    result: Any = query_smartlead(endpoint=f"campaigns/{campaign_id}", method="GET")
+def get_campaign_by_id(
+    campaign_id: int, use_cache: bool = True
+) -> SmartleadCampaign:
+    return get_metadata_cache().get_or_load(
+        campaign_key(campaign_id),
+        lambda: _load_campaign_by_id(campaign_id),
+        refresh=not use_cache,
+    )
+
+
+def _load_campaign_by_id(campaign_id: int) -> SmartleadCampaign:
+    raw = query_smartlead_raw(endpoint=f"campaigns/{campaign_id}", method="GET")
     try:
-        campaign = SmartleadCampaign.model_validate(result)
+        campaign = SmartleadCampaign.model_validate_json(raw)
         return campaign
     except Exception as e:
         raise ValueError(
@@ -78,106 +149,314 @@ def get_campaign_by_id(campaign_id: int) -> SmartleadCampaign:
         ) from e
 
 
-def get_leads_by_campaign_id_with_pagination(
-    campaign_id: int,
-    lead_category_id: Optional[int] = None,
-    event_time: Optional[str] = None,
-) -> List[SmartleadCampaignLead]:
-    leads: List[SmartleadCampaignLead] = []
+def get_campaigns_by_ids(
+    campaign_ids: Iterable[int], max_workers: int = 8, use_cache: bool = True
+) -> Tuple[Dict[int, SmartleadCampaign], Dict[int, Exception]]:
+    """Fetch many campaigns concurrently.
+
+    IDs are deduped and keep their first-seen order. Returns the campaigns that
+    loaded plus the error raised for every ID that did not.
+    """
+    unique_ids = list(dict.fromkeys(int(campaign_id) for campaign_id in campaign_ids))
+    campaigns: Dict[int, SmartleadCampaign] = {}
+    errors: Dict[int, Exception] = {}
+    if not unique_ids:
+        return campaigns, errors
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        futures = {
+            campaign_id: executor.submit(get_campaign_by_id, campaign_id, use_cache)
+            for campaign_id in unique_ids
+        }
+        for campaign_id, future in futures.items():
+            try:
+                campaigns[campaign_id] = future.result()
+            except Exception as e:
+                errors[campaign_id] = e
+
+    return campaigns, errors
+
+
+def _fetch_leads_page_raw(
+    campaign_id: int, params: Dict[str, Any], offset: int, max_retries: int
+) -> bytes:
+    """Fetch one raw lead page, retrying failures up to `max_retries` times."""
+    for attempt in range(max_retries + 1):
+        try:
+            return query_smartlead_raw(
+                endpoint=f"campaigns/{campaign_id}/leads",
+                method="GET",
+                query_params={**params, "offset": offset},
+            )
+        except Exception as e:
+            logging.error(
+                f"Error getting leads for campaign {campaign_id} at offset {offset} "
+                f"(attempt {attempt + 1}/{max_retries + 1}): {e}"
+            )
+            if attempt == max_retries:
+                raise RuntimeError(
+                    f"Giving up on leads for campaign {campaign_id} at offset {offset}: {e}"
+                ) from e
+            time.sleep(min(2**attempt, 30))
+
 
-    # Initial request
+def _iter_lead_pages(
+    campaign_id: int,
+    params: Dict[str, Any],
+    parse: Callable[[bytes], PageT],
+    max_workers: Optional[int] = None,
+    checkpoint: Optional[LeadPaginationCheckpoint] = None,
+    max_page_retries: int = SMARTLEAD_PAGE_MAX_RETRIES,
+) -> Iterator[PageT]:
+    """Offset pagination over /campaigns/{id}/leads, generic over page parsing.
+
+    Pages already recorded in `checkpoint` are replayed from disk instead of
+    being refetched, unless the fresh first page reports a different
+    total_leads; the checkpoint is cleared once the last page is yielded.
+    """
+    completed = checkpoint.completed_offsets() if checkpoint is not None else set()
+
+    def load(offset: int) -> PageT:
+        if offset in completed:
+            return parse(checkpoint.load_page(offset))
+        raw = _fetch_leads_page_raw(campaign_id, params, offset, max_page_retries)
+        page = parse(raw)
+        if checkpoint is not None:
+            checkpoint.save_page(offset, raw)
+        return page
+
+    # Initial request; fails like any other page once its retries run out.
+    # Page 0 is always fetched fresh: if total_leads moved since the checkpoint
+    # was written, the offsets have shifted and the stored pages are unusable.
+    raw_first_page = _fetch_leads_page_raw(campaign_id, params, 0, max_page_retries)
+    first_page = parse(raw_first_page)
+    if checkpoint is not None:
+        if completed and (
+            0 not in completed
+            or parse(checkpoint.load_page(0)).total_leads != first_page.total_leads
+        ):
+            checkpoint.clear()
+            completed.clear()
+        checkpoint.save_page(0, raw_first_page)
+
+    yield first_page
+    total_leads = first_page.total_leads
+    fetched = len(first_page.data)
+
+    # Parallel pagination: every offset is known up front
+    if max_workers and max_workers > 1 and first_page.limit > 0:
+        offsets = iter(range(fetched, total_leads, first_page.limit))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(load, offset) for offset in islice(offsets, max_workers)
+            )
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(load, next_offset))
+                yield page
+    else:
+        # Pagination
+        while fetched < total_leads:
+            page = load(fetched)
+            if not page.data:
+                break
+            fetched += len(page.data)
+            yield page
+
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+def _lead_filter_params(
+    lead_category_id: Optional[int], event_time: Optional[str]
+) -> Dict[str, Any]:
+    # Filters are sent with every page, not just the first one
     params = {}
     if event_time:
         params["event_time_gt"] = event_time
     if lead_category_id:
         params["lead_category_id"] = lead_category_id
+    return params
+
+
+def iter_campaign_lead_pages(
+    campaign_id: int,
+    lead_category_id: Optional[int] = None,
+    event_time: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoint: bool = False,
+    max_page_retries: int = SMARTLEAD_PAGE_MAX_RETRIES,
+) -> Iterator[SmartleadGetCampaignLeadsResponse]:
+    """Yield validated lead pages in offset order as they arrive.
+
+    With `max_workers` > 1 pages are fetched concurrently, but never more than
+    `max_workers` pages are in flight, so memory stays bounded.
+
+    With `checkpoint=True` completed pages are persisted locally per campaign
+    and filter, so a fetch interrupted by an error or a restart resumes where
+    it stopped. A page that still fails after `max_page_retries` retries
+    raises instead of being retried forever.
+    """
+    params = _lead_filter_params(lead_category_id, event_time)
+    yield from _iter_lead_pages(
+        campaign_id,
+        params,
+        SmartleadGetCampaignLeadsResponse.model_validate_json,
+        max_workers=max_workers,
+        checkpoint=(
+            LeadPaginationCheckpoint(campaign_id, params) if checkpoint else None
+        ),
+        max_page_retries=max_page_retries,
+    )
+
+
+def iter_raw_campaign_lead_pages(
+    campaign_id: int,
+    lead_category_id: Optional[int] = None,
+    event_time: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoint: bool = False,
+    max_page_retries: int = SMARTLEAD_PAGE_MAX_RETRIES,
+) -> Iterator[SmartleadRawLeadsPage]:
+    """Same as iter_campaign_lead_pages, but rows stay plain dicts.
+
+    For consumers that convert rows to another representation anyway (e.g. an
+    Arrow table) and do not need a model per lead.
+    """
+    params = _lead_filter_params(lead_category_id, event_time)
+    yield from _iter_lead_pages(
+        campaign_id,
+        params,
+        SmartleadRawLeadsPage.model_validate_json,
+        max_workers=max_workers,
+        checkpoint=(
+            LeadPaginationCheckpoint(campaign_id, params) if checkpoint else None
+        ),
+        max_page_retries=max_page_retries,
+    )
+
 
+def iter_campaign_leads(
+    campaign_id: int,
+    lead_category_id: Optional[int] = None,
+    event_time: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoint: bool = False,
+) -> Iterator[SmartleadCampaignLead]:
+    """Stream a campaign's leads one by one without holding the whole campaign."""
+    for page in iter_campaign_lead_pages(
+        campaign_id,
+        lead_category_id=lead_category_id,
+        event_time=event_time,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
+    ):
+        yield from page.data
+
+
+def get_leads_by_campaign_id_with_pagination(
+    campaign_id: int,
+    lead_category_id: Optional[int] = None,
+    event_time: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoint: bool = False,
+) -> List[SmartleadCampaignLead]:
+    """List a campaign's leads; returns [] if the first page cannot be fetched."""
+    pages = iter_campaign_lead_pages(
+        campaign_id,
+        lead_category_id=lead_category_id,
+        event_time=event_time,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
+    )
     try:
-        response = query_smartlead(
-            endpoint=f"campaigns/{campaign_id}/leads",
-            method="GET",
-            query_params=params,
-        )
-        first_page = SmartleadGetCampaignLeadsResponse.model_validate(response)
-        total_leads = first_page.total_leads
-        leads.extend(first_page.data)
+        first_page = next(pages)
     except Exception as e:
         logging.error(f"Error fetching first page: {e}")
-        return leads
+        return []
 
-    # Pagination
-    while len(leads) < total_leads:
-        page = []
-        try:
-            offset_params = {"offset": len(leads)}
-            if event_time:
-                offset_params["event_time_gt"] = event_time
+    leads = list(first_page.data)
+    for page in pages:
+        leads.extend(page.data)
+    return leads
 
-            response = query_smartlead(
-                endpoint=f"campaigns/{campaign_id}/leads",
-                method="GET",
-                query_params=offset_params,
-            )
 
-            page = SmartleadGetCampaignLeadsResponse.model_validate(response)
+def get_campaigns(use_cache: bool = True) -> list[SmartleadCampaign]:
+    campaigns = get_metadata_cache().get_or_load(
+        campaigns_key(), _load_campaigns, refresh=not use_cache
+    )
+    return list(campaigns)
 
-            leads.extend(page.data)
 
-            time.sleep(1)
-        except Exception as e:
-            logging.error(
-                f"Error getting leads for campaign {campaign_id} at offset {len(leads)}: {e}"
-            )
-            continue
+def _load_campaigns() -> list[SmartleadCampaign]:
+    raw = query_smartlead_raw("/campaigns", method="GET")
 
-    return leads
+    try:
+        # 🚀 Pydantic v2: validate the raw JSON array straight into models
+        return _CAMPAIGNS_ADAPTER.validate_json(raw)
 
+    except ValidationError as e:
+        raise RuntimeError(f"Smartlead campaign schema validation failed:\n{e}") from e
 
-def get_campaigns() -> list[SmartleadCampaign]:
-    result = query_smartlead("/campaigns", method="GET")
 
-    if not isinstance(result, list):
-        raise RuntimeError(
-            f"Unexpected Smartlead response (expected list, got {type(result)}): {result}"
-        )
+def get_campaign_summaries(use_cache: bool = True) -> List[CampaignSummary]:
+    """Campaign list validated into `CampaignSummary` (id, name, status) only.
 
-    try:
-        # 🚀 Pydantic v2: validate a list of campaign objects
-        return [SmartleadCampaign.model_validate(item) for item in result]
+    Use this instead of get_campaigns() when only labels are needed; the other
+    campaign fields are skipped during validation.
+    """
+    summaries = get_metadata_cache().get_or_load(
+        campaign_summaries_key(), _load_campaign_summaries, refresh=not use_cache
+    )
+    return list(summaries)
 
+
+def _load_campaign_summaries() -> List[CampaignSummary]:
+    raw = query_smartlead_raw("/campaigns", method="GET")
+
+    try:
+        return _CAMPAIGN_SUMMARIES_ADAPTER.validate_json(raw)
     except ValidationError as e:
         raise RuntimeError(f"Smartlead campaign schema validation failed:\n{e}") from e
 
 
 def get_campaign_statistics(campaign_id: str) -> SmartleadCampaignStatistics:
     try:
-        resp = query_smartlead(f"/campaigns/{campaign_id}/analytics", method="GET")
+        raw = query_smartlead_raw(f"/campaigns/{campaign_id}/analytics", method="GET")
     except Exception as e:
         raise RuntimeError(
             f"Failed to get campaign statistics for campaign {campaign_id}: {e}"
         ) from e
 
     try:
-        return SmartleadCampaignStatistics.model_validate(resp, strict=False)
+        return SmartleadCampaignStatistics.model_validate_json(raw, strict=False)
     except ValidationError as e:
         raise RuntimeError(
             f"Smartlead campaign statistics schema validation failed for {campaign_id}:\n{e}"
         ) from e
 
 
-def get_campaign_sequences(campaign_id: int) -> List[SmartleadCampaignSequence]:
-    result = query_smartlead(
+def get_campaign_sequences(
+    campaign_id: int, use_cache: bool = True
+) -> List[SmartleadCampaignSequence]:
+    sequences = get_metadata_cache().get_or_load(
+        sequences_key(campaign_id),
+        lambda: _load_campaign_sequences(campaign_id),
+        refresh=not use_cache,
+    )
+    return list(sequences)
+
+
+def _load_campaign_sequences(campaign_id: int) -> List[SmartleadCampaignSequence]:
+    raw = query_smartlead_raw(
         endpoint=f"/campaigns/{campaign_id}/sequences",
         method="GET",
     )
 
-    if not isinstance(result, list):
-        raise RuntimeError(
-            f"Unexpected Smartlead response for sequences (expected list, got {type(result)}): {result}"
-        )
-
     try:
-        return [SmartleadCampaignSequence.model_validate(item) for item in result]
+        return _SEQUENCES_ADAPTER.validate_json(raw)
     except ValidationError as e:
         raise RuntimeError(
             f"Smartlead campaign sequences schema validation failed for campaign {campaign_id}:\n{e}"
@@ -185,8 +464,27 @@ def get_campaign_sequences(campaign_id: int) -> List[SmartleadCampaignSequence]:
 
 
 def add_sequences_to_campaign(
-    *, campaign_id: int, input_sequences: List[SmartleadCampaignSequenceInput]
-) -> None:
+    *,
+    campaign_id: int,
+    input_sequences: List[SmartleadCampaignSequenceInput],
+    skip_if_unchanged: bool = True,
+) -> Optional[SmartleadSequenceDiff]:
+    """Write a campaign's full sequence list.
+
+    By default the input is first diffed against the campaign's current
+    sequences (the cached copy, which read-modify-write callers have just
+    refreshed) and nothing is sent when they already match. Returns that
+    diff, with `written` set when a POST was made; returns None when
+    `skip_if_unchanged=False`.
+    """
+    diff = None
+    if skip_if_unchanged:
+        diff = diff_sequences(
+            get_campaign_sequences(int(campaign_id)), input_sequences
+        )
+        if not diff.has_changes:
+            return diff
+
     try:
         sequences_payload = [
             seq.model_dump(by_alias=True, exclude_none=True) for seq in input_sequences
@@ -206,3 +504,9 @@ def add_sequences_to_campaign(
         raise RuntimeError(
             f"Error adding sequences to campaign {campaign_id}: {msg}"
         ) from e
+    finally:
+        invalidate_sequences(campaign_id)
+
+    if diff is not None:
+        diff.written = True
+    return diff
@@ -0,0 +1,119 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..transport import build_http_client
+
+
+SMARTLEAD_INTERNAL_REST_API = "https://server.smartlead.ai/api/"
+SMARTLEAD_INTERNAL_GRAPHQL_API = "https://fe-gql.smartlead.ai/v1/graphql"
+SMARTLEAD_INTERNAL_HTTP_TIMEOUT = float(
+    os.getenv("SMARTLEAD_INTERNAL_HTTP_TIMEOUT", "30")
+)
+
+_client: Optional["SmartleadInternalClient"] = None
+_client_lock = threading.Lock()
+
+
+class SmartleadInternalClient:
+    """Pooled connections and cached auth headers for the internal Smartlead APIs.
+
+    The REST API (server.smartlead.ai/api) and the GraphQL API
+    (fe-gql.smartlead.ai) each get their own connection pool, so busy GraphQL
+    traffic cannot starve REST calls of keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        timeout: float = SMARTLEAD_INTERNAL_HTTP_TIMEOUT,
+        rest_client: Optional[httpx.Client] = None,
+        graphql_client: Optional[httpx.Client] = None,
+    ):
+        self._token = token
+        self.timeout = timeout
+        self._rest = rest_client or build_http_client(
+            base_url=SMARTLEAD_INTERNAL_REST_API, timeout=timeout
+        )
+        self._graphql = graphql_client or build_http_client(timeout=timeout)
+        self._auth_headers: Optional[Dict[str, str]] = None
+
+    def auth_headers(self) -> Dict[str, str]:
+        """Authorization headers, built once from the token on first use."""
+        if self._auth_headers is None:
+            token = self._token or os.getenv("SMARTLEAD_INTERNAL_API_TOKEN")
+            if not token:
+                raise RuntimeError("Missing SMARTLEAD_INTERNAL_API_TOKEN")
+            self._auth_headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+        return self._auth_headers
+
+    def _send(
+        self,
+        client: httpx.Client,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        body: Any,
+        query_params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+    ) -> httpx.Response:
+        return client.request(
+            method.upper(),
+            url,
+            headers={**self.auth_headers(), **(headers or {})},
+            json=body,
+            params=query_params,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+
+    def rest_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        return self._send(
+            self._rest, method, endpoint, headers, body, query_params, timeout
+        )
+
+    def graphql_request(
+        self,
+        method: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        return self._send(
+            self._graphql,
+            method,
+            SMARTLEAD_INTERNAL_GRAPHQL_API,
+            headers,
+            body,
+            query_params,
+            timeout,
+        )
+
+    def close(self) -> None:
+        self._rest.close()
+        self._graphql.close()
+
+
+def get_internal_client() -> SmartleadInternalClient:
+    """Process-wide internal-API client shared by every internal helper."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = SmartleadInternalClient()
+    return _client
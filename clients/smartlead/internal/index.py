@@ -1,8 +1,68 @@
+import json
+import logging
 import os
-from typing import Any, Dict, Optional
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from ..schema import SmartleadGetCampaignSequencesViaGraphQLResponse
+import httpx
+
+from common.single_flight import SingleFlight, request_key
+
+from ..cache import invalidate_campaign
+from ..rate_limit import send_with_rate_limit
+from ..schema import (
+    CampaignLeadCounts,
+    SmartleadGetCampaignSequencesViaGraphQLResponse,
+    SmartleadLeadRemovalResult,
+)
+from .client import get_internal_client
+from .operations import (
+    find_operation,
+    get_operation_metrics,
+    persisted_query_support,
+    register_operation,
+)
+
+
+_in_flight = SingleFlight()
+
+# Campaigns per aliased GraphQL document in batched reads
+SMARTLEAD_GRAPHQL_BATCH_SIZE = int(os.getenv("SMARTLEAD_GRAPHQL_BATCH_SIZE", "50"))
+
+# Leads per delete request; smaller chunks stay well inside the request timeout
+SMARTLEAD_LEAD_REMOVAL_CHUNK_SIZE = int(
+    os.getenv("SMARTLEAD_LEAD_REMOVAL_CHUNK_SIZE", "200")
+)
+SMARTLEAD_LEAD_REMOVAL_MAX_RETRIES = int(
+    os.getenv("SMARTLEAD_LEAD_REMOVAL_MAX_RETRIES", "3")
+)
+
+CAMPAIGN_SEQUENCES_SELECTION = """
+        name
+        sequences: email_campaign_seq_mappings(order_by: {seq_number: asc}) {
+          id
+          ...BasicEmailCampaignSeqMappingsFragment
+          email_seq_variant_mappings {
+            id
+            variant_label
+            __typename
+          }
+          __typename
+        }
+        __typename
+"""
+
+SEQ_MAPPINGS_FRAGMENT = """
+    fragment BasicEmailCampaignSeqMappingsFragment on email_campaign_seq_mappings {
+      seq_number
+      subject
+      email_body
+      seq_type
+      seq_schedule_type
+      __typename
+    }
+"""
 
 
 def get_campaign_sequences(
@@ -36,35 +96,307 @@ def get_campaign_sequences(
     }
     """
 
+    result = execute_graphql_operation(
+        "getSequencesByCampaignId", query, {"id": campaign_id}
+    )
+
+    return SmartleadGetCampaignSequencesViaGraphQLResponse.model_validate(result)
+
+
+def _build_batched_sequences_query(campaign_ids: List[int]) -> str:
+    variables = ", ".join(f"$id{index}: Int!" for index in range(len(campaign_ids)))
+    selections = "".join(
+        f"\n      c{index}: email_campaigns_by_pk(id: $id{index}) {{"
+        f"{CAMPAIGN_SEQUENCES_SELECTION}      }}"
+        for index in range(len(campaign_ids))
+    )
+    return f"""
+    query getSequencesByCampaignIds({variables}) {{{selections}
+    }}
+    {SEQ_MAPPINGS_FRAGMENT}"""
+
+
+def _get_campaign_sequences_batch(
+    campaign_ids: List[int],
+) -> Dict[int, SmartleadGetCampaignSequencesViaGraphQLResponse]:
     result = query_smartlead_internal_graphql_endpoint(
         method="POST",
         body={
-            "query": query,
-            "variables": {"id": campaign_id},
-            "operationName": "getSequencesByCampaignId",
+            "query": _build_batched_sequences_query(campaign_ids),
+            "variables": {
+                f"id{index}": campaign_id
+                for index, campaign_id in enumerate(campaign_ids)
+            },
+            "operationName": "getSequencesByCampaignIds",
         },
     )
+    data = _raise_for_graphql_errors(result)
+    sequences = {}
+    for index, campaign_id in enumerate(campaign_ids):
+        campaign = data.get(f"c{index}")
+        # Unknown or inaccessible campaigns come back as null
+        if campaign is None:
+            continue
+        sequences[campaign_id] = (
+            SmartleadGetCampaignSequencesViaGraphQLResponse.model_validate(
+                {"data": {"email_campaigns_by_pk": campaign}}
+            )
+        )
+    return sequences
 
-    return SmartleadGetCampaignSequencesViaGraphQLResponse.model_validate(result)
 
+def get_campaign_sequences_by_ids(
+    campaign_ids: Iterable[int],
+    batch_size: int = SMARTLEAD_GRAPHQL_BATCH_SIZE,
+    max_workers: int = 4,
+) -> Dict[int, SmartleadGetCampaignSequencesViaGraphQLResponse]:
+    """Read the sequences of many campaigns in a few GraphQL round trips.
 
-def remove_multiple_leads_from_campaign(
-    smartlead_campaign_id: str, email_lead_ids: list[int], email_lead_map_ids: list[int]
-) -> dict:
-    if len(email_lead_ids) != len(email_lead_map_ids):
-        raise ValueError("emailLeadIds and emailLeadMapIds must have the same length")
+    Campaigns are grouped into documents of `batch_size` aliased
+    `email_campaigns_by_pk` selections, and the batches run concurrently.
+    Campaigns that do not exist are left out of the result.
+    """
+    unique_ids = list(dict.fromkeys(int(campaign_id) for campaign_id in campaign_ids))
+    batches = [
+        unique_ids[start : start + batch_size]
+        for start in range(0, len(unique_ids), batch_size)
+    ]
+    if not batches:
+        return {}
+
+    sequences: Dict[int, SmartleadGetCampaignSequencesViaGraphQLResponse] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        for batch_sequences in executor.map(_get_campaign_sequences_batch, batches):
+            sequences.update(batch_sequences)
+    return sequences
+
+
+def _raise_for_graphql_errors(result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("errors"):
+        raise SmartleadGraphQLError(
+            f"Email Server Error with GraphQL - {result['errors']}"
+        )
+    return result.get("data") or {}
+
+
+def _query_lead_mappings_by_alias(
+    operation_name: str, selection: str, wheres: List[Dict[str, Any]]
+) -> List[Any]:
+    """Run `selection` once per where clause as aliased fields of one document.
+
+    `{where}` in `selection` is replaced with each alias's where variable.
+    Returns the value of each alias in the order of `wheres`.
+    """
+    variables = ", ".join(
+        f"$w{index}: email_campaign_leads_mappings_bool_exp!"
+        for index in range(len(wheres))
+    )
+    fields = "".join(
+        f"\n      a{index}: " + selection.replace("{where}", f"$w{index}")
+        for index in range(len(wheres))
+    )
+    data = _raise_for_graphql_errors(
+        query_smartlead_internal_graphql_endpoint(
+            method="POST",
+            body={
+                "query": f"query {operation_name}({variables}) {{{fields}\n    }}",
+                "variables": {
+                    f"w{index}": where for index, where in enumerate(wheres)
+                },
+                "operationName": operation_name,
+            },
+        )
+    )
+    return [data.get(f"a{index}") for index in range(len(wheres))]
+
+
+def _run_lead_mapping_batches(
+    operation_name: str,
+    selection: str,
+    wheres: List[Dict[str, Any]],
+    max_workers: int,
+) -> List[Any]:
+    batches = [
+        wheres[start : start + SMARTLEAD_GRAPHQL_BATCH_SIZE]
+        for start in range(0, len(wheres), SMARTLEAD_GRAPHQL_BATCH_SIZE)
+    ]
+    if not batches:
+        return []
 
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        results = executor.map(
+            lambda batch: _query_lead_mappings_by_alias(
+                operation_name, selection, batch
+            ),
+            batches,
+        )
+        return [value for batch_values in results for value in batch_values]
+
+
+def get_campaign_lead_counts_by_ids(
+    campaign_ids: Iterable[int], max_workers: int = 4
+) -> Dict[int, CampaignLeadCounts]:
+    """Count leads per status and category without transferring lead rows.
+
+    The statuses and categories present are discovered with `distinct_on`,
+    then every count is an aliased `email_campaign_leads_mappings_aggregate`
+    field, batched into a few documents for all campaigns at once.
+    """
+    unique_ids = list(dict.fromkeys(int(campaign_id) for campaign_id in campaign_ids))
+    if not unique_ids:
+        return {}
+
+    def campaign_where(campaign_id: int, **conditions: Any) -> Dict[str, Any]:
+        return {"email_campaign_id": {"_eq": campaign_id}, **conditions}
+
+    group_columns = ("status", "lead_category_id")
+    distinct_rows = {}
+    for column in group_columns:
+        values = _run_lead_mapping_batches(
+            "getCampaignLeadGroups",
+            f"email_campaign_leads_mappings(where: {{where}}, distinct_on: {column})"
+            f" {{ {column} }}",
+            [campaign_where(campaign_id) for campaign_id in unique_ids],
+            max_workers,
+        )
+        distinct_rows[column] = dict(zip(unique_ids, values))
+
+    # (campaign_id, kind, group value) per aggregate, in request order
+    keys = []
+    wheres = []
+    for campaign_id in unique_ids:
+        keys.append((campaign_id, "total", None))
+        wheres.append(campaign_where(campaign_id))
+        keys.append((campaign_id, "unsent", None))
+        wheres.append(campaign_where(campaign_id, last_sent_time={"_is_null": True}))
+        for column in group_columns:
+            for row in distinct_rows[column][campaign_id] or []:
+                value = row[column]
+                keys.append((campaign_id, column, value))
+                wheres.append(
+                    campaign_where(
+                        campaign_id,
+                        **{
+                            column: (
+                                {"_is_null": True} if value is None else {"_eq": value}
+                            )
+                        },
+                    )
+                )
+
+    aggregates = _run_lead_mapping_batches(
+        "getCampaignLeadCounts",
+        "email_campaign_leads_mappings_aggregate(where: {where})"
+        " { aggregate { count } }",
+        wheres,
+        max_workers,
+    )
+
+    counts = {
+        campaign_id: CampaignLeadCounts(campaign_id=campaign_id, total=0, unsent=0)
+        for campaign_id in unique_ids
+    }
+    for (campaign_id, kind, value), aggregate in zip(keys, aggregates):
+        count = int(aggregate["aggregate"]["count"])
+        campaign_counts = counts[campaign_id]
+        if kind == "total":
+            campaign_counts.total = count
+        elif kind == "unsent":
+            campaign_counts.unsent = count
+        elif kind == "status":
+            campaign_counts.by_status[value] = count
+        elif value is None:
+            campaign_counts.uncategorized = count
+        else:
+            campaign_counts.by_category[int(value)] = count
+    return counts
+
+
+def get_campaign_lead_counts(campaign_id: int) -> CampaignLeadCounts:
+    return get_campaign_lead_counts_by_ids([campaign_id])[int(campaign_id)]
+
+
+def _remove_lead_chunk(
+    smartlead_campaign_id: str,
+    email_lead_ids: List[int],
+    email_lead_map_ids: List[int],
+    max_retries: int,
+) -> None:
     body = {
         "campaignId": smartlead_campaign_id,
         "emailLeadIds": email_lead_ids,
         "emailLeadMapIds": email_lead_map_ids,
     }
 
-    return query_smartlead_internal_rest_endpoint(
-        endpoint="email-campaigns/delete-email-campaign-multiple-leads",
-        method="POST",
-        body=body,
-    )
+    for attempt in range(max_retries + 1):
+        try:
+            query_smartlead_internal_rest_endpoint(
+                endpoint="email-campaigns/delete-email-campaign-multiple-leads",
+                method="POST",
+                body=body,
+            )
+            return
+        except Exception as e:
+            logging.error(
+                f"Error removing {len(email_lead_map_ids)} leads from campaign "
+                f"{smartlead_campaign_id} "
+                f"(attempt {attempt + 1}/{max_retries + 1}): {e}"
+            )
+            if attempt == max_retries:
+                raise
+            time.sleep(min(2**attempt, 30))
+
+
+def remove_multiple_leads_from_campaign(
+    smartlead_campaign_id: str,
+    email_lead_ids: list[int],
+    email_lead_map_ids: list[int],
+    chunk_size: int = SMARTLEAD_LEAD_REMOVAL_CHUNK_SIZE,
+    max_workers: int = 4,
+    max_retries: int = SMARTLEAD_LEAD_REMOVAL_MAX_RETRIES,
+) -> SmartleadLeadRemovalResult:
+    """Remove leads from a campaign in chunks, submitting chunks concurrently.
+
+    Each chunk is retried on its own, so a failing chunk does not undo or
+    block the rest; check `ok` and the `failed_*` IDs on the result.
+    """
+    if len(email_lead_ids) != len(email_lead_map_ids):
+        raise ValueError("emailLeadIds and emailLeadMapIds must have the same length")
+
+    chunks = [
+        (
+            email_lead_ids[start : start + chunk_size],
+            email_lead_map_ids[start : start + chunk_size],
+        )
+        for start in range(0, len(email_lead_ids), chunk_size)
+    ]
+    result = SmartleadLeadRemovalResult()
+    if not chunks:
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        futures = {
+            executor.submit(
+                _remove_lead_chunk,
+                smartlead_campaign_id,
+                lead_ids,
+                lead_map_ids,
+                max_retries,
+            ): (lead_ids, lead_map_ids)
+            for lead_ids, lead_map_ids in chunks
+        }
+        for future in as_completed(futures):
+            lead_ids, lead_map_ids = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                result.failed_lead_ids.extend(lead_ids)
+                result.failed_lead_map_ids.extend(lead_map_ids)
+                result.errors.append(str(e))
+            else:
+                result.removed_lead_ids.extend(lead_ids)
+                result.removed_lead_map_ids.extend(lead_map_ids)
+    return result
 
 
 def update_smartlead_campaign_follow_up_percentage(
@@ -86,14 +418,56 @@ def update_smartlead_campaign_follow_up_percentage(
     }
     """
 
-    return query_smartlead_internal_graphql_endpoint(
-        method="POST",
-        body={
-            "query": query,
-            "variables": variables,
-            "operationName": "updateCampaignById",
-        },
-    )
+    try:
+        return execute_graphql_operation("updateCampaignById", query, variables)
+    finally:
+        invalidate_campaign(campaign_id)
+
+
+def update_smartlead_campaigns_follow_up_percentage(
+    *,
+    campaign_ids: Iterable[int],
+    follow_up_percentage: float,
+) -> List[int]:
+    """Set follow_up_percentage on many campaigns in one mutation.
+
+    Returns the IDs Smartlead actually updated; IDs it does not know (or the
+    token cannot access) are missing from the result.
+    """
+    unique_ids = list(dict.fromkeys(int(campaign_id) for campaign_id in campaign_ids))
+    if not unique_ids:
+        return []
+
+    query = """
+    mutation updateCampaignsByIds(
+      $ids: [Int!]!,
+      $changes: email_campaigns_set_input!
+    ) {
+      update_email_campaigns(where: {id: {_in: $ids}}, _set: $changes) {
+        affected_rows
+        returning {
+          id
+        }
+        __typename
+      }
+    }
+    """
+
+    try:
+        data = _raise_for_graphql_errors(
+            execute_graphql_operation(
+                "updateCampaignsByIds",
+                query,
+                {
+                    "ids": unique_ids,
+                    "changes": {"follow_up_percentage": follow_up_percentage},
+                },
+            )
+        )
+        return [row["id"] for row in data["update_email_campaigns"]["returning"]]
+    finally:
+        for campaign_id in unique_ids:
+            invalidate_campaign(campaign_id)
 
 
 def query_smartlead_internal_rest_endpoint(
@@ -102,36 +476,34 @@ def query_smartlead_internal_rest_endpoint(
     body: dict = None,
     headers: dict = None,
     query_params: dict = None,
+    timeout: Optional[float] = None,
 ) -> dict:
-    import requests
-    import os
-
-    base_url = "https://server.smartlead.ai/api/"
-    url = f"{base_url}{endpoint}"
-
-    auth_token = os.environ.get("SMARTLEAD_INTERNAL_API_TOKEN")
-    if not auth_token:
-        raise RuntimeError("Missing SMARTLEAD_INTERNAL_API_TOKEN")
+    client = get_internal_client()
 
-    final_headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json",
-    }
-    if headers:
-        final_headers.update(headers)
+    def send() -> httpx.Response:
+        return send_with_rate_limit(
+            lambda: client.rest_request(
+                method,
+                endpoint,
+                headers=headers,
+                body=body,
+                query_params=query_params,
+                timeout=timeout,
+            )
+        )
 
+    response = None
     try:
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=final_headers,
-            json=body,
-            params=query_params,
-            timeout=30,
-        )
+        if method.upper() == "GET":
+            response = _in_flight.do(
+                request_key(method.upper(), endpoint, query_params, body, headers),
+                send,
+            )
+        else:
+            response = send()
         response.raise_for_status()
         return response.json()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         try:
             err_json = response.json()
             err_msg = err_json.get("error", str(e))
@@ -146,48 +518,169 @@ class SmartleadGraphQLError(RuntimeError):
     pass
 
 
+def _is_graphql_query(body: Any) -> bool:
+    if not isinstance(body, dict):
+        return False
+    document = body.get("query")
+    if document is None:
+        # Persisted-query requests carry only the hash; look the text up
+        operation = find_operation(body.get("operationName"))
+        document = operation.document if operation else ""
+    return not document.lstrip().startswith("mutation")
+
+
+def _graphql_error_entries(payload: Any) -> List[Dict[str, Any]]:
+    """GraphQL `errors`, or a top-level Hasura-style `{"error", "code"}` body."""
+    if not isinstance(payload, dict):
+        return []
+    if payload.get("errors"):
+        return [error for error in payload["errors"] if isinstance(error, dict)]
+    if "error" in payload or "code" in payload:
+        return [payload]
+    return []
+
+
+def _error_code_and_message(error: Dict[str, Any]) -> Tuple[str, str]:
+    code = error.get("code") or (error.get("extensions") or {}).get("code", "")
+    message = error.get("message") or error.get("error") or ""
+    return str(code), str(message)
+
+
+def _is_persisted_query_miss(payload: Any) -> bool:
+    """True when the server asks for the full text of a hash-only request."""
+    for error in _graphql_error_entries(payload):
+        code, message = _error_code_and_message(error)
+        if "PERSISTED_QUERY_NOT_FOUND" in code or "PersistedQueryNotFound" in message:
+            return True
+    return False
+
+
+def _is_persisted_query_unsupported(payload: Any) -> bool:
+    """True when the server rejects a hash-only request for lacking a query."""
+    for error in _graphql_error_entries(payload):
+        code, message = _error_code_and_message(error)
+        if (
+            "PERSISTED_QUERY_NOT_SUPPORTED" in code
+            or "PersistedQueryNotSupported" in message
+            or code == "parse-failed"
+            or ("'query'" in message and "not present" in message)
+        ):
+            return True
+    return False
+
+
+def _error_response_payload(error: SmartleadGraphQLError) -> Any:
+    """JSON body of the HTTP error behind `error`, if there was one."""
+    cause = error.__cause__
+    if not isinstance(cause, httpx.HTTPStatusError):
+        return None
+    try:
+        return cause.response.json()
+    except ValueError:
+        return None
+
+
+def execute_graphql_operation(
+    name: str,
+    document: str,
+    variables: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Run a named operation, sending only its sha256 hash when possible.
+
+    The first hash-only request probes whether the server supports persisted
+    queries (APQ). On a cache miss the full text is sent along with the hash
+    so the server can store it. Only an explicit "query missing" rejection
+    marks the server as lacking APQ, after which every request sends the
+    plain full-text body. A transport error or 5xx during the probe falls
+    back for that call; after SMARTLEAD_GRAPHQL_PERSISTED_PROBE_LIMIT such
+    probes the server is treated as lacking APQ too.
+    """
+    operation = register_operation(name, document)
+    body: Dict[str, Any] = {"operationName": name, "variables": variables or {}}
+
+    if persisted_query_support.supported is not False:
+        extensions = operation.persisted_query_extension()
+        try:
+            result = query_smartlead_internal_graphql_endpoint(
+                method="POST", headers=headers, body={**body, "extensions": extensions}
+            )
+        except SmartleadGraphQLError as e:
+            if persisted_query_support.supported:
+                raise
+            if _is_persisted_query_unsupported(_error_response_payload(e)):
+                persisted_query_support.supported = False
+            else:
+                persisted_query_support.record_inconclusive_probe()
+            result = None
+
+        if result is not None:
+            if _is_persisted_query_miss(result):
+                body["extensions"] = extensions
+            elif (
+                not persisted_query_support.supported
+                and _is_persisted_query_unsupported(result)
+            ):
+                # Hash-only request rejected outright: the server has no APQ
+                persisted_query_support.supported = False
+            else:
+                persisted_query_support.supported = True
+                return result
+
+    return query_smartlead_internal_graphql_endpoint(
+        method="POST", headers=headers, body={**body, "query": operation.document}
+    )
+
+
 def query_smartlead_internal_graphql_endpoint(
     *,
     method: str,
     headers: Optional[Dict[str, str]] = None,
     body: Optional[Any] = None,
     query_params: Optional[Dict[str, Any]] = None,
-    timeout: int = 30,
+    timeout: Optional[float] = None,
 ) -> Dict[str, Any]:
-    INTERNAL_SMARTLEAD_GRAPHQL_API = "https://fe-gql.smartlead.ai/v1/graphql"
-    token = os.getenv("SMARTLEAD_INTERNAL_API_TOKEN")
-    if not token:
-        raise SmartleadGraphQLError("Missing SMARTLEAD_INTERNAL_API_TOKEN env var")
-
-    base_headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
-    merged_headers = {**base_headers, **(headers or {})}
+    client = get_internal_client()
 
-    # Try to extract operationName for debug logs (mirrors the TS behavior)
+    # operationName keys the per-operation metrics (and debug logs, as in TS)
     op_name = None
+    persisted = False
     if isinstance(body, dict):
         op_name = body.get("operationName")
+        persisted = "query" not in body and "extensions" in body
 
-    try:
-        resp = requests.request(
-            method=method.upper(),
-            url=INTERNAL_SMARTLEAD_GRAPHQL_API,
-            headers=merged_headers,
-            json=body,
-            params=query_params,
-            timeout=timeout,
+    def send() -> httpx.Response:
+        return send_with_rate_limit(
+            lambda: client.graphql_request(
+                method,
+                headers=headers,
+                body=body,
+                query_params=query_params,
+                timeout=timeout,
+            )
         )
+
+    started = time.monotonic()
+    resp = None
+    failed = True
+    payload = None
+    try:
+        # Identical concurrent queries share one upstream call; mutations never do
+        if _is_graphql_query(body):
+            resp = _in_flight.do(request_key(body, query_params, headers), send)
+        else:
+            resp = send()
         # Raise for HTTP errors (>=400)
         resp.raise_for_status()
-        return resp.json()
+        result = payload = resp.json()
+        failed = isinstance(result, dict) and bool(result.get("errors"))
+        return result
 
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         # HTTP error with a response payload
         err_data = None
         try:
-            err_data = resp.json()  # type: ignore[has-type]
+            err_data = payload = resp.json()  # type: ignore[has-type]
         except Exception:
             pass
 
@@ -201,8 +694,25 @@ def query_smartlead_internal_graphql_endpoint(
             msg = f"Email Server Error with GraphQL - {getattr(err_data, 'error', None) or resp.text or str(e)}"
         raise SmartleadGraphQLError(msg) from e
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         # Network/timeout/connection issues
         # Try to pull nested response error message if present
         msg = f"Email Server Error with GraphQL - {getattr(getattr(e, 'response', None), 'text', None) or str(e)}"
         raise SmartleadGraphQLError(msg) from e
+
+    finally:
+        # A hash-only request the server answers with "send the full text" is
+        # part of the APQ handshake, not a failure of the operation
+        persisted_miss = persisted and (
+            _is_persisted_query_miss(payload)
+            or _is_persisted_query_unsupported(payload)
+        )
+        get_operation_metrics().record(
+            op_name,
+            latency=time.monotonic() - started,
+            request_bytes=len(json.dumps(body)) if body is not None else 0,
+            response_bytes=len(resp.content) if resp is not None else 0,
+            error=failed and not persisted_miss,
+            persisted=persisted and not persisted_miss,
+            persisted_miss=persisted_miss,
+        )
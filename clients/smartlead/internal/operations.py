@@ -0,0 +1,143 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Optional
+
+
+# Send registered operations as persisted-query hashes (APQ) when the server
+# accepts them; full text is always the fallback.
+SMARTLEAD_GRAPHQL_PERSISTED_QUERIES = os.getenv(
+    "SMARTLEAD_GRAPHQL_PERSISTED_QUERIES", "1"
+).lower() not in ("0", "false", "no")
+# Probes that end in a transport error or 5xx say nothing about APQ support;
+# after this many the server is treated as lacking it, so a server that hangs
+# on hash-only bodies does not cost a full timeout on every call.
+SMARTLEAD_GRAPHQL_PERSISTED_PROBE_LIMIT = int(
+    os.getenv("SMARTLEAD_GRAPHQL_PERSISTED_PROBE_LIMIT", "3")
+)
+
+
+class GraphQLOperation:
+    """A named GraphQL document with its persisted-query hash computed once."""
+
+    def __init__(self, name: str, document: str):
+        self.name = name
+        self.document = document
+        self.sha256 = hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+    def persisted_query_extension(self) -> Dict[str, Dict[str, object]]:
+        return {"persistedQuery": {"version": 1, "sha256Hash": self.sha256}}
+
+
+_operations: Dict[str, GraphQLOperation] = {}
+_operations_lock = threading.Lock()
+
+
+def register_operation(name: str, document: str) -> GraphQLOperation:
+    """Register `document` under its operation name; re-registering is a no-op."""
+    with _operations_lock:
+        operation = _operations.get(name)
+        if operation is None:
+            operation = _operations[name] = GraphQLOperation(name, document)
+        elif operation.document != document:
+            raise ValueError(f"GraphQL operation {name} is already registered")
+        return operation
+
+
+def find_operation(name: Optional[str]) -> Optional[GraphQLOperation]:
+    return _operations.get(name) if name else None
+
+
+class _PersistedQuerySupport:
+    """Whether the GraphQL server accepts hash-only requests (None = unknown)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.supported: Optional[bool] = (
+            None if SMARTLEAD_GRAPHQL_PERSISTED_QUERIES else False
+        )
+        self.inconclusive_probes = 0
+
+    def record_inconclusive_probe(self) -> None:
+        """Count a probe that failed for unrelated reasons; give up at the limit."""
+        with self._lock:
+            self.inconclusive_probes += 1
+            if (
+                self.supported is None
+                and self.inconclusive_probes >= SMARTLEAD_GRAPHQL_PERSISTED_PROBE_LIMIT
+            ):
+                self.supported = False
+
+
+persisted_query_support = _PersistedQuerySupport()
+
+
+class OperationMetrics:
+    """Thread-safe per-operation counters for GraphQL calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, float]] = {}
+
+    def record(
+        self,
+        operation_name: Optional[str],
+        *,
+        latency: float,
+        request_bytes: int,
+        response_bytes: int,
+        error: bool,
+        persisted: bool = False,
+        persisted_miss: bool = False,
+    ) -> None:
+        """Count one call.
+
+        `persisted_miss` marks a hash-only request the server answered with
+        "send the full text"; it is counted there, not as an error.
+        """
+        name = operation_name or "anonymous"
+        with self._lock:
+            counters = self._counters.setdefault(
+                name,
+                {
+                    "calls": 0,
+                    "errors": 0,
+                    "persisted_calls": 0,
+                    "persisted_misses": 0,
+                    "total_latency": 0.0,
+                    "max_latency": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                },
+            )
+            counters["calls"] += 1
+            counters["errors"] += int(error)
+            counters["persisted_calls"] += int(persisted)
+            counters["persisted_misses"] += int(persisted_miss)
+            counters["total_latency"] += latency
+            counters["max_latency"] = max(counters["max_latency"], latency)
+            counters["request_bytes"] += request_bytes
+            counters["response_bytes"] += response_bytes
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Counters per operation, with average latency and error rate."""
+        with self._lock:
+            return {
+                name: {
+                    **counters,
+                    "avg_latency": counters["total_latency"] / counters["calls"],
+                    "error_rate": counters["errors"] / counters["calls"],
+                }
+                for name, counters in self._counters.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+_operation_metrics = OperationMetrics()
+
+
+def get_operation_metrics() -> OperationMetrics:
+    return _operation_metrics
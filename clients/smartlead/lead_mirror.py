@@ -0,0 +1,132 @@
+import os
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional
+
+from clients.smartlead.index import iter_campaign_lead_pages
+from clients.smartlead.local_store import connect
+from clients.smartlead.schema import SmartleadCampaignLead
+
+
+# Re-read a small window before the last watermark so clock skew between us
+# and Smartlead cannot drop events.
+SMARTLEAD_LEAD_MIRROR_OVERLAP_SECONDS = float(
+    os.getenv("SMARTLEAD_LEAD_MIRROR_OVERLAP_SECONDS", "300")
+)
+
+
+def _ensure_tables(conn) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS lead_mirror_leads (
+            campaign_id INTEGER NOT NULL,
+            campaign_lead_map_id INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (campaign_id, campaign_lead_map_id)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS lead_mirror_watermarks (
+            campaign_id INTEGER PRIMARY KEY,
+            synced_through TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _format_event_time(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def get_lead_watermark(campaign_id: int) -> Optional[str]:
+    with closing(connect()) as conn, conn:
+        _ensure_tables(conn)
+        row = conn.execute(
+            "SELECT synced_through FROM lead_mirror_watermarks WHERE campaign_id = ?",
+            (int(campaign_id),),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def reset_lead_mirror(campaign_id: int) -> None:
+    with closing(connect()) as conn, conn:
+        _ensure_tables(conn)
+        conn.execute(
+            "DELETE FROM lead_mirror_leads WHERE campaign_id = ?", (int(campaign_id),)
+        )
+        conn.execute(
+            "DELETE FROM lead_mirror_watermarks WHERE campaign_id = ?",
+            (int(campaign_id),),
+        )
+
+
+def sync_campaign_leads(
+    campaign_id: int, max_workers: Optional[int] = None, full: bool = False
+) -> int:
+    """Bring the local mirror of a campaign's leads up to date.
+
+    Only leads with events after the stored watermark are requested
+    (`event_time_gt`), so repeat syncs cost proportional to what changed. The
+    first sync, or `full=True`, pulls the whole campaign. Smartlead does not
+    report deletions through this filter; use `full=True` to drop leads that
+    were removed upstream. Returns the number of leads written.
+    """
+    if full:
+        reset_lead_mirror(campaign_id)
+
+    watermark = get_lead_watermark(campaign_id)
+    sync_started_at = datetime.now(timezone.utc) - timedelta(
+        seconds=SMARTLEAD_LEAD_MIRROR_OVERLAP_SECONDS
+    )
+
+    written = 0
+    for page in iter_campaign_lead_pages(
+        campaign_id, event_time=watermark, max_workers=max_workers
+    ):
+        with closing(connect()) as conn, conn:
+            _ensure_tables(conn)
+            conn.executemany(
+                "INSERT OR REPLACE INTO lead_mirror_leads"
+                " (campaign_id, campaign_lead_map_id, payload) VALUES (?, ?, ?)",
+                [
+                    (
+                        int(campaign_id),
+                        lead.campaign_lead_map_id,
+                        lead.model_dump_json(),
+                    )
+                    for lead in page.data
+                ],
+            )
+        written += len(page.data)
+
+    with closing(connect()) as conn, conn:
+        _ensure_tables(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO lead_mirror_watermarks"
+            " (campaign_id, synced_through) VALUES (?, ?)",
+            (int(campaign_id), _format_event_time(sync_started_at)),
+        )
+    return written
+
+
+def iter_mirrored_leads(campaign_id: int) -> Iterator[SmartleadCampaignLead]:
+    with closing(connect()) as conn:
+        _ensure_tables(conn)
+        cursor = conn.execute(
+            "SELECT payload FROM lead_mirror_leads WHERE campaign_id = ?"
+            " ORDER BY campaign_lead_map_id",
+            (int(campaign_id),),
+        )
+        for (payload,) in cursor:
+            yield SmartleadCampaignLead.model_validate_json(payload)
+
+
+def get_mirrored_leads(
+    campaign_id: int, sync: bool = True, max_workers: Optional[int] = None
+) -> List[SmartleadCampaignLead]:
+    """Return a campaign's leads from the local mirror, syncing it first."""
+    if sync:
+        sync_campaign_leads(campaign_id, max_workers=max_workers)
+    return list(iter_mirrored_leads(campaign_id))
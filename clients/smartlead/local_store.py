@@ -0,0 +1,20 @@
+import os
+import sqlite3
+import tempfile
+
+
+SMARTLEAD_LOCAL_STORE_PATH = os.getenv(
+    "SMARTLEAD_LOCAL_STORE_PATH",
+    os.path.join(tempfile.gettempdir(), "smartlead_local_store.sqlite3"),
+)
+
+
+def connect() -> sqlite3.Connection:
+    """Open a connection to the on-disk store shared by the Smartlead helpers.
+
+    Connections are cheap, so each call site opens its own; this keeps the
+    store safe to use from worker threads.
+    """
+    conn = sqlite3.connect(SMARTLEAD_LOCAL_STORE_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+
+SMARTLEAD_RATE_LIMIT_PER_SECOND = float(
+    os.getenv("SMARTLEAD_RATE_LIMIT_PER_SECOND", "5")
+)
+SMARTLEAD_RATE_LIMIT_BURST = int(os.getenv("SMARTLEAD_RATE_LIMIT_BURST", "10"))
+SMARTLEAD_RATE_LIMIT_MAX_RETRIES = int(
+    os.getenv("SMARTLEAD_RATE_LIMIT_MAX_RETRIES", "5")
+)
+DEFAULT_RETRY_AFTER_SECONDS = 2.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every Smartlead request in the process.
+
+    Tokens are reserved rather than polled: each caller takes a token
+    immediately (possibly going into debt) and sleeps until that token is due,
+    so concurrent callers queue up fairly and throughput sits at `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            ready_at = self._updated_at + max(0.0, -self._tokens) / self.rate
+            return max(0.0, ready_at - now)
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds` (e.g. after a 429 Retry-After)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated_at = max(self._updated_at, now + seconds)
+
+
+_limiter = TokenBucket(SMARTLEAD_RATE_LIMIT_PER_SECOND, SMARTLEAD_RATE_LIMIT_BURST)
+
+
+def get_rate_limiter() -> TokenBucket:
+    return _limiter
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    value: Optional[str] = headers.get("Retry-After")
+    if not value:
+        return DEFAULT_RETRY_AFTER_SECONDS
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def send_with_rate_limit(send: Callable[[], Any]) -> Any:
+    """Run `send` under the shared limiter, backing off on 429 responses.
+
+    The last response is returned as-is, so callers keep their own
+    raise_for_status() error handling once retries are exhausted.
+    """
+    limiter = get_rate_limiter()
+    max_retries = SMARTLEAD_RATE_LIMIT_MAX_RETRIES
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        response = send()
+        if response.status_code != 429 or attempt == max_retries:
+            return response
+        limiter.pause(retry_after_seconds(response.headers))
+
+
+async def send_with_rate_limit_async(send: Callable[[], Awaitable[Any]]) -> Any:
+    """Async counterpart of send_with_rate_limit, sharing the same bucket."""
+    limiter = get_rate_limiter()
+    max_retries = SMARTLEAD_RATE_LIMIT_MAX_RETRIES
+    for attempt in range(max_retries + 1):
+        await limiter.acquire_async()
+        response = await send()
+        if response.status_code != 429 or attempt == max_retries:
+            return response
+        limiter.pause(retry_after_seconds(response.headers))
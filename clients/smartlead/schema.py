@@ -70,6 +70,15 @@ class SmartleadGetCampaignLeadsResponse(BaseModel):
     data: List[SmartleadCampaignLead]
 
 
+class SmartleadRawLeadsPage(BaseModel):
+    """Lead page whose rows are left as plain dicts (no per-lead models)."""
+
+    total_leads: int
+    offset: int
+    limit: int
+    data: List[Dict[str, Any]]
+
+
 class SchedulerCronValue(BaseModel):
     tz: str
     days: List[int]
@@ -97,6 +106,14 @@ class SmartleadCampaign(BaseModel):
     client_id: Optional[int]
 
 
+class CampaignSummary(BaseModel):
+    """Projection of SmartleadCampaign for lists and selectboxes."""
+
+    id: int
+    name: str
+    status: StatusEnum
+
+
 class CampaignLeadStats(BaseModel):
     total: int
     paused: int
@@ -108,6 +125,37 @@ class CampaignLeadStats(BaseModel):
     notStarted: int
 
 
+class SmartleadLeadRemovalResult(BaseModel):
+    """Aggregated outcome of a chunked lead removal from one campaign."""
+
+    removed_lead_ids: List[int] = Field(default_factory=list)
+    removed_lead_map_ids: List[int] = Field(default_factory=list)
+    failed_lead_ids: List[int] = Field(default_factory=list)
+    failed_lead_map_ids: List[int] = Field(default_factory=list)
+    errors: List[str] = Field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed_lead_map_ids
+
+
+class CampaignLeadCounts(BaseModel):
+    """Lead counts for one campaign, computed with GraphQL aggregates."""
+
+    campaign_id: int
+    total: int
+    # Leads that have not been sent any email yet (last_sent_time is null)
+    unsent: int
+    by_status: Dict[str, int] = Field(default_factory=dict)
+    # Keyed by lead_category_id; leads without a category are in `uncategorized`
+    by_category: Dict[int, int] = Field(default_factory=dict)
+    uncategorized: int = 0
+
+    @property
+    def sent(self) -> int:
+        return self.total - self.unsent
+
+
 class SmartleadCampaignStatistics(BaseModel):
     id: int
     user_id: int
@@ -190,6 +238,32 @@ class SmartleadCampaignSequenceInput(BaseModel):
     seq_variants: Optional[List[SequenceVariantInput]] = None
 
 
+class SmartleadSequenceDiff(BaseModel):
+    """Difference between a campaign's sequences and a desired input list.
+
+    Sequences are matched by seq_number and listed by seq_number.
+    """
+
+    added: List[int] = Field(default_factory=list)
+    removed: List[int] = Field(default_factory=list)
+    changed: List[int] = Field(default_factory=list)
+    written: bool = False
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class SmartleadBulkSequenceWriteResult(BaseModel):
+    """Outcome of one campaign's read-modify-write in a bulk sequence run."""
+
+    campaign_id: int
+    ok: bool
+    error: Optional[str] = None
+    # None when the builder skipped the campaign
+    diff: Optional[SmartleadSequenceDiff] = None
+
+
 class EmailSeqVariantMapping(BaseModel):
     id: int
     variant_label: str
@@ -0,0 +1,68 @@
+from typing import Any, Dict, List, Optional
+
+from clients.smartlead.schema import (
+    SmartleadCampaignSequence,
+    SmartleadCampaignSequenceInput,
+    SmartleadSequenceDiff,
+)
+
+
+def _percentage(value: Optional[float]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _normalize_current(sequence: SmartleadCampaignSequence) -> Dict[str, Any]:
+    return {
+        "subject": sequence.subject or "",
+        "email_body": sequence.email_body or "",
+        "delay_in_days": sequence.seq_delay_details.delayInDays,
+        "variants": sorted(
+            (
+                v.variant_label,
+                v.subject or "",
+                v.email_body or "",
+                _percentage(v.variant_distribution_percentage),
+            )
+            for v in sequence.sequence_variants or []
+        ),
+    }
+
+
+def _normalize_input(sequence: SmartleadCampaignSequenceInput) -> Dict[str, Any]:
+    return {
+        "subject": sequence.subject or "",
+        "email_body": sequence.email_body or "",
+        "delay_in_days": (
+            sequence.seq_delay_details.delay_in_days
+            if sequence.seq_delay_details
+            else None
+        ),
+        "variants": sorted(
+            (
+                v.variant_label,
+                v.subject or "",
+                v.email_body or "",
+                _percentage(v.variant_distribution_percentage),
+            )
+            for v in sequence.seq_variants or []
+        ),
+    }
+
+
+def diff_sequences(
+    current: List[SmartleadCampaignSequence],
+    desired: List[SmartleadCampaignSequenceInput],
+) -> SmartleadSequenceDiff:
+    """Compare sequence content by seq_number, ignoring server-assigned IDs."""
+    current_by_number = {seq.seq_number: _normalize_current(seq) for seq in current}
+    desired_by_number = {seq.seq_number: _normalize_input(seq) for seq in desired}
+
+    return SmartleadSequenceDiff(
+        added=sorted(set(desired_by_number) - set(current_by_number)),
+        removed=sorted(set(current_by_number) - set(desired_by_number)),
+        changed=sorted(
+            number
+            for number in set(current_by_number) & set(desired_by_number)
+            if current_by_number[number] != desired_by_number[number]
+        ),
+    )
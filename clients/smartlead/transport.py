@@ -0,0 +1,76 @@
+import os
+import threading
+from typing import Optional
+
+import httpx
+
+
+SMARTLEAD_HTTP_POOL_SIZE = int(os.getenv("SMARTLEAD_HTTP_POOL_SIZE", "20"))
+SMARTLEAD_HTTP_KEEPALIVE = int(os.getenv("SMARTLEAD_HTTP_KEEPALIVE", "10"))
+SMARTLEAD_HTTP_KEEPALIVE_EXPIRY = float(
+    os.getenv("SMARTLEAD_HTTP_KEEPALIVE_EXPIRY", "30")
+)
+SMARTLEAD_HTTP_TIMEOUT = float(os.getenv("SMARTLEAD_HTTP_TIMEOUT", "30"))
+SMARTLEAD_HTTP2 = os.getenv("SMARTLEAD_HTTP2", "1") != "0"
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def http2_enabled() -> bool:
+    """HTTP/2 is negotiated via ALPN, so it only needs the optional `h2` package."""
+    if not SMARTLEAD_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=SMARTLEAD_HTTP_POOL_SIZE,
+        max_keepalive_connections=SMARTLEAD_HTTP_KEEPALIVE,
+        keepalive_expiry=SMARTLEAD_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def build_http_client(**kwargs) -> httpx.Client:
+    kwargs.setdefault("timeout", SMARTLEAD_HTTP_TIMEOUT)
+    # requests followed redirects by default; keep that behaviour
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.Client(http2=http2_enabled(), limits=build_limits(), **kwargs)
+
+
+def build_async_http_client(**kwargs) -> httpx.AsyncClient:
+    kwargs.setdefault("timeout", SMARTLEAD_HTTP_TIMEOUT)
+    # requests followed redirects by default; keep that behaviour
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.AsyncClient(http2=http2_enabled(), limits=build_limits(), **kwargs)
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide pooled client shared by every Smartlead API helper."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = build_http_client()
+    return _client
+
+
+def smartlead_error(endpoint: str, error: httpx.HTTPError) -> Exception:
+    """Build the exception surfaced for a failed public-API call."""
+    if isinstance(error, httpx.HTTPStatusError):
+        try:
+            error_data = error.response.json()
+            error_msg = error_data.get("error", str(error))
+            detailed_msg = error_data.get("message", "")
+        except ValueError:
+            error_msg = str(error)
+            detailed_msg = ""
+        return Exception(
+            f"Email Server Error with {endpoint} - {error_msg} : {detailed_msg}"
+        )
+    return Exception(f"Email Server Error with {endpoint} - {str(error)}")
@@ -2,17 +2,21 @@ import streamlit as st
 import pandas as pd
 from typing import Optional, List
 
+from clients.smartlead.bulk import iter_bulk_sequence_writes
 from clients.smartlead.index import (
+    SmartleadCampaignSequence,
     SmartleadCampaignSequenceInput,
-    add_sequences_to_campaign,
-    get_campaign_sequences,
-    get_campaign_statistics,
-    get_campaigns,
+    get_campaign_summaries,
 )
 from clients.smartlead.internal.index import (
-    update_smartlead_campaign_follow_up_percentage,
+    get_campaign_lead_counts_by_ids,
+    update_smartlead_campaigns_follow_up_percentage,
+)
+from clients.smartlead.schema import (
+    CampaignLeadCounts,
+    SeqDelayDetailsInput,
+    SequenceVariantInput,
 )
-from clients.smartlead.schema import SeqDelayDetailsInput, SequenceVariantInput
 
 st.title("Add Follow-ups to Smartlead Campaigns")
 
@@ -26,19 +30,17 @@ ss.setdefault("successful_campaigns", [])
 ss.setdefault("failed_campaigns", [])
 
 
-def add_follow_ups_to_campaign(
+def build_follow_up_sequences(
     *,
-    smartlead_campaign_id: int,
+    sequences: List[SmartleadCampaignSequence],
     delay_period: int,
     expected_sequence_length: Optional[int] = None,
-) -> None:
-    sequences = get_campaign_sequences(int(smartlead_campaign_id))
-
+) -> Optional[List[SmartleadCampaignSequenceInput]]:
     if (
         expected_sequence_length is not None
         and len(sequences) >= expected_sequence_length
     ):
-        return  # nothing to do
+        return None  # nothing to do
 
     # Build inputs for the original sequences
     original_inputs: List[SmartleadCampaignSequenceInput] = []
@@ -102,23 +104,20 @@ def add_follow_ups_to_campaign(
             )
         )
 
-    input_sequences = original_inputs + clones
+    return original_inputs + clones
 
-    try:
-        add_sequences_to_campaign(
-            campaign_id=int(smartlead_campaign_id),
-            input_sequences=input_sequences,
-        )
-    except Exception as e:
-        raise RuntimeError(
-            f"Error adding sequences to campaign {smartlead_campaign_id}: {getattr(e, 'message', str(e))}"
-        ) from e
+
+def should_bump_follow_up_percentage(lead_counts: CampaignLeadCounts) -> bool:
+    """True once ≥70% of the campaign's leads were sent (or it has none)."""
+    total_leads = lead_counts.total
+    sent_ratio = 0 if total_leads == 0 else lead_counts.sent / total_leads
+    return total_leads == 0 or sent_ratio >= 0.70
 
 
 # --- 1) Fetch campaigns for selection ---
 with st.spinner("Loading campaigns..."):
     if not ss.all_campaigns:
-        ss.all_campaigns = get_campaigns()  # expect list of {id, name, ...}
+        ss.all_campaigns = get_campaign_summaries()  # id, name, status only
 
 # Build multiselect options as label->id mapping
 options = {f"Campaign ID: {c.id}, name: {c.name or ''}": c.id for c in ss.all_campaigns}
@@ -165,55 +164,69 @@ if ss.running_add_followups:
     progress = st.progress(0)
     status = st.empty()
 
+    # Workers cannot read session state, so capture the inputs up front
+    change_follow_up_percentage = bool(ss.change_follow_up_percentage)
+    delay_period = int(ss.delay_period)
+    # Optional 90% follow-up percentage bump: lead counts come from a few
+    # aggregate-only requests and all qualifying campaigns share one mutation.
+    # A failure here is only a warning; follow-ups are still added below.
+    if change_follow_up_percentage:
+        bump_ids = []
+        try:
+            lead_counts = get_campaign_lead_counts_by_ids(ss.selected_campaigns)
+            bump_ids = [
+                cid
+                for cid, counts in lead_counts.items()
+                if should_bump_follow_up_percentage(counts)
+            ]
+            bumped_ids = set(
+                update_smartlead_campaigns_follow_up_percentage(
+                    campaign_ids=bump_ids, follow_up_percentage=90
+                )
+            )
+        except Exception as e:
+            bumped_ids = set()
+            not_bumped = bump_ids or ss.selected_campaigns
+            st.warning(
+                f"⚠️ Failed to update follow-up percentages ({e}); not updated for campaign(s): {', '.join(map(str, not_bumped))}"
+            )
+        else:
+            not_bumped = [cid for cid in bump_ids if cid not in bumped_ids]
+            if not_bumped:
+                st.warning(
+                    f"Follow-up percentage was not updated for campaign(s): {', '.join(map(str, not_bumped))}"
+                )
+
+    def build_campaign_follow_ups(
+        campaign_id: int, sequences: List[SmartleadCampaignSequence]
+    ) -> Optional[List[SmartleadCampaignSequenceInput]]:
+        return build_follow_up_sequences(
+            sequences=sequences, delay_period=delay_period
+        )
+
     with st.spinner("Adding follow-ups to campaigns..."):
-        for i, cid in enumerate(ss.selected_campaigns, start=1):
+        results = iter_bulk_sequence_writes(
+            ss.selected_campaigns, build_campaign_follow_ups
+        )
+        for i, result in enumerate(results, start=1):
+            cid = result.campaign_id
             label = next(
                 (lbl for lbl, _cid in options.items() if _cid == cid),
                 f"Campaign ID: {cid}",
             )
-            try:
-                # Optional 90% follow-up percentage bump
-                if ss.change_follow_up_percentage:
-                    stats = get_campaign_statistics(int(cid))
-                    # Expect structure similar to TS:
-                    # stats["campaign_lead_stats"]["total"], stats["unique_sent_count"]
-                    total_leads = int(stats.campaign_lead_stats.total)
-                    unique_sent_count = int(stats.unique_sent_count)
-                    sent_ratio = (
-                        0 if total_leads == 0 else unique_sent_count / total_leads
-                    )
-
-                    if total_leads == 0 or sent_ratio >= 0.70:
-                        update_smartlead_campaign_follow_up_percentage(
-                            campaign_id=int(cid), follow_up_percentage=90
-                        )
-
-                # Add follow-ups
-                add_follow_ups_to_campaign(
-                    smartlead_campaign_id=int(cid),
-                    delay_period=int(ss.delay_period),
-                )
-
-                ss.successful_campaigns.append(
-                    {
-                        "Campaign ID": cid,
-                        "Campaign Name": label,
-                        "Link": f"https://app.smartlead.ai/app/email-campaign/{cid}/analytics",
-                        "Error": "N/A",
-                    }
-                )
-            except Exception as e:
+            row = {
+                "Campaign ID": cid,
+                "Campaign Name": label,
+                "Link": f"https://app.smartlead.ai/app/email-campaign/{cid}/analytics",
+            }
+            if result.ok:
+                ss.successful_campaigns.append({**row, "Error": "N/A"})
+            else:
                 ss.failed_campaigns.append(
-                    {
-                        "Campaign ID": cid,
-                        "Campaign Name": label,
-                        "Link": f"https://app.smartlead.ai/app/email-campaign/{cid}/analytics",
-                        "Error": str(e) or "Error adding follow-ups",
-                    }
+                    {**row, "Error": result.error or "Error adding follow-ups"}
                 )
-            finally:
-                status.write(f"Processed {i}/{total}: {label}")
-                progress.progress(i / total)
+            status.write(f"Processed {i}/{total}: {label}")
+            progress.progress(i / total)
 
     # Done
     ss.running_add_followups = False
@@ -1,11 +1,14 @@
 import streamlit as st
 from typing import Any, Dict, List, Optional, TypedDict
 from clients.smartlead.index import (
-    get_campaigns,
+    get_campaign_summaries,
     get_campaign_sequences,
     add_sequences_to_campaign,
 )
-from clients.smartlead.schema import SmartleadCampaignSequenceInput
+from clients.smartlead.schema import (
+    SmartleadCampaignSequenceInput,
+    SmartleadSequenceDiff,
+)
 import re
 
 
@@ -35,12 +38,12 @@ def apply_template_to_campaign_helper(
     smartlead_campaign_id: int,
     smartlead_template_id: int,
     company_name: str,
-) -> None:
+) -> Optional[SmartleadSequenceDiff]:
     template_sequences: List[Dict[str, Any]] = get_campaign_sequences(
-        smartlead_template_id
+        smartlead_template_id, use_cache=False
     )
     current_sequences: List[Dict[str, Any]] = get_campaign_sequences(
-        smartlead_campaign_id
+        smartlead_campaign_id, use_cache=False
     )
 
     input_sequences: List[SmartleadCampaignSequenceInput] = []
@@ -76,7 +79,7 @@ def apply_template_to_campaign_helper(
             )
         )
 
-    add_sequences_to_campaign(
+    return add_sequences_to_campaign(
         campaign_id=smartlead_campaign_id,
         input_sequences=input_sequences,
     )
@@ -92,7 +95,7 @@ ss.setdefault("running_apply_template", False)
 
 # Load campaigns once
 with st.spinner("Loading campaigns..."):
-    ss.all_campaigns = get_campaigns()
+    ss.all_campaigns = get_campaign_summaries()
 
 if not ss.all_campaigns:
     st.error("No campaigns found.")
@@ -138,14 +141,19 @@ if st.button("Apply Template", type="primary", disabled=disabled):
     ss["running_apply_template"] = True
     try:
         with st.spinner("Applying template..."):
-            apply_template_to_campaign_helper(
+            diff = apply_template_to_campaign_helper(
                 smartlead_campaign_id=int(target_campaign.id),
                 smartlead_template_id=int(template_campaign.id),
                 company_name=company_name.strip(),
             )
-        st.success(
-            f"✅ Template from Campaign {template_campaign.id} applied to Campaign {target_campaign.id} for “{company_name.strip()}”."
-        )
+        if diff is not None and not diff.written:
+            st.info(
+                f"Campaign {target_campaign.id} already matches the template for “{company_name.strip()}”; nothing was changed."
+            )
+        else:
+            st.success(
+                f"✅ Template from Campaign {template_campaign.id} applied to Campaign {target_campaign.id} for “{company_name.strip()}”."
+            )
     except Exception as e:
         st.error(f"Failed to apply template: {e}")
     finally:
@@ -2,7 +2,7 @@ from clients.smartlead.index import (
     get_campaign_sequences,
     add_sequences_to_campaign,
     SmartleadCampaignSequenceInput,
-    get_campaigns,
+    get_campaign_summaries,
 )
 from bs4 import BeautifulSoup
 import streamlit as st
@@ -217,7 +217,7 @@ if "github_repo" not in st.session_state:
 st.title("Campaign Editor")
 
 # Campaign ID input
-campaigns = get_campaigns()
+campaigns = get_campaign_summaries()
 campaign_options = {c.name: c.id for c in campaigns}
 selected_campaign_name = st.selectbox(
     "Select Campaign", options=list(campaign_options.keys())
@@ -233,7 +233,7 @@ if st.button("Load Campaign", type="primary"):
             st.session_state.github_repo = repo
 
             # Load sequences
-            sequences = get_campaign_sequences(campaign_id)
+            sequences = get_campaign_sequences(campaign_id, use_cache=False)
             if sequences:
                 st.session_state.sequences = sequences[:2]
 
@@ -501,13 +501,18 @@ if st.session_state.sequences:
                                 )
                                 input_sequences.append(cloned_seq)
 
-                        add_sequences_to_campaign(
+                        diff = add_sequences_to_campaign(
                             campaign_id=campaign_id,
                             input_sequences=input_sequences,
                         )
-                        st.success(
-                            "✅ Successfully updated Smartlead campaign sequences"
-                        )
+                        if diff is not None and not diff.written:
+                            st.info(
+                                "Smartlead campaign sequences already up to date; nothing to write"
+                            )
+                        else:
+                            st.success(
+                                "✅ Successfully updated Smartlead campaign sequences"
+                            )
                     except Exception as e:
                         st.error(f"Failed to update Smartlead campaign: {e}")
 
@@ -2,20 +2,19 @@ import streamlit as st
 from datetime import datetime
 from typing import List, Dict
 
+from clients.smartlead.bulk import iter_bulk_sequence_writes
 from clients.smartlead.index import (
+    SmartleadCampaignSequence,
     SmartleadCampaignSequenceInput,
-    add_sequences_to_campaign,
-    get_campaign_sequences,
-    get_campaigns,
+    get_campaign_summaries,
 )
 
 
 def replace_phrases_inside_template(
-    smartlead_campaign_id: int,
+    sequences: List[SmartleadCampaignSequence],
     phrases_to_replace: List[str],
     replacement_text: str,
-):
-    sequences = get_campaign_sequences(smartlead_campaign_id)
+) -> List[SmartleadCampaignSequenceInput]:
     updated_sequences = []
     for sequence in sequences:
         if sequence.sequence_variants:
@@ -72,17 +71,14 @@ def replace_phrases_inside_template(
             )
         )
 
-    add_sequences_to_campaign(
-        campaign_id=smartlead_campaign_id,
-        input_sequences=input_sequences,
-    )
+    return input_sequences
 
 
 def edit_campaign_messages():
     st.header("✏️ Rewrite Smartlead Campaign Templates")
     conn = st.connection("postgresql", type="sql")
     with st.spinner("Fetching Smartlead campaigns..."):
-        campaigns = get_campaigns()
+        campaigns = get_campaign_summaries()
     campaigns_by_id = {str(c.id): c for c in campaigns}
     campaigns_to_rewrite: List[Dict] = []
     campaign_options = [f"{c.name} (ID: {c.id})" for c in campaigns]
@@ -115,16 +111,21 @@ def edit_campaign_messages():
         failed = []
         progress = st.progress(0)
         total = len(campaigns_to_rewrite)
-        for idx, campaign in enumerate(campaigns_to_rewrite, start=1):
-            try:
-                replace_phrases_inside_template(
-                    smartlead_campaign_id=campaign.get("id"),
-                    phrases_to_replace=phrases_to_replace,
-                    replacement_text=replacement_text,
-                )
+        campaigns_by_int_id = {int(c["id"]): c for c in campaigns_to_rewrite}
+        results = iter_bulk_sequence_writes(
+            campaigns_by_int_id.keys(),
+            lambda _campaign_id, sequences: replace_phrases_inside_template(
+                sequences=sequences,
+                phrases_to_replace=phrases_to_replace,
+                replacement_text=replacement_text,
+            ),
+        )
+        for idx, result in enumerate(results, start=1):
+            campaign = campaigns_by_int_id[result.campaign_id]
+            if result.ok:
                 successful.append(campaign)
-            except Exception as e:
-                st.error(f"Error rewriting campaign {campaign['id']}: {e}")
+            else:
+                st.error(f"Error rewriting campaign {campaign['id']}: {result.error}")
                 failed.append(campaign)
 
             progress.progress(idx / total)
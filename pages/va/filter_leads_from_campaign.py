@@ -8,8 +8,8 @@ import streamlit as st
 from azure.storage.blob import ContentSettings
 
 from clients.azure_blob_storage.index import get_or_create_blob_service_client
-from clients.cohesive.index import get_campaign_leads_by_id_with_mapping
-from clients.smartlead.index import get_campaign_by_id
+from clients.cohesive.index import iter_campaign_leads_by_emails_with_mapping
+from clients.smartlead.index import get_campaigns_by_ids
 from clients.smartlead.internal.index import remove_multiple_leads_from_campaign
 from common.utils import chunk_list, csv_to_json, get_gpt_answer
 
@@ -183,13 +183,10 @@ ss.selected_org_id = st.selectbox(
 
 # Filter campaigns for the org
 org_campaigns = campaigns[campaigns["organizationId"] == ss.selected_org_id]
-campaign_details = []
-for _, row in org_campaigns.iterrows():
-    try:
-        campaign_detail = get_campaign_by_id(int(row["campaignId"]))
-        campaign_details.append(campaign_detail)
-    except Exception as e:
-        continue
+campaigns_by_id, _ = get_campaigns_by_ids(
+    int(campaign_id) for campaign_id in org_campaigns["campaignId"]
+)
+campaign_details = list(campaigns_by_id.values())
 
 campaign_options = {c.id: c.name for c in campaign_details}
 campaign_ids = list(campaign_options.keys())
@@ -268,18 +265,13 @@ if st.button("🚀 Filter and Upload Leads", key="filter_upload_btn"):
             ss.leads_to_remove = leads_to_remove
             ss.filtered_blob_url = url
 
-            # Precompute campaign leads & mapping
-            leads = get_campaign_leads_by_id_with_mapping(
-                campaign_id=int(ss.selected_campaign_id)
-            )
-
-            # Match by email
+            # Fetch only the campaign lead mappings matching the filtered emails
             ss.lead_details = [
                 {"leadId": lead["email_lead"]["id"], "leadMappingId": lead["id"]}
-                for lead in leads
-                if any(
-                    ltr.get("Email") == (lead.get("email_lead") or {}).get("email")
-                    for ltr in leads_to_remove
+                for lead in iter_campaign_leads_by_emails_with_mapping(
+                    campaign_id=int(ss.selected_campaign_id),
+                    emails=[ltr.get("Email") for ltr in leads_to_remove],
+                    projection="ids_only",
                 )
             ]
 
@@ -308,7 +300,7 @@ if ss.lead_details:
 if ss.removing:
     with st.spinner("Removing leads... please wait"):
         try:
-            remove_multiple_leads_from_campaign(
+            result = remove_multiple_leads_from_campaign(
                 smartlead_campaign_id=str(ss.selected_campaign_id),
                 email_lead_ids=[ld["leadId"] for ld in ss.lead_details],
                 email_lead_map_ids=[ld["leadMappingId"] for ld in ss.lead_details],
@@ -318,8 +310,18 @@ if ss.removing:
                 f"❌ Failed to remove leads from campaign {ss.selected_campaign_name}: {e}"
             )
         else:
-            st.success(
-                f"✅ Removed {len(ss.lead_details)} leads from {ss.selected_campaign_name}."
-            )
+            if result.removed_lead_map_ids:
+                st.success(
+                    f"✅ Removed {len(result.removed_lead_map_ids)} leads from {ss.selected_campaign_name}."
+                )
+            if not result.ok:
+                st.error(
+                    f"❌ Failed to remove {len(result.failed_lead_map_ids)} leads from campaign {ss.selected_campaign_name}: {'; '.join(result.errors)}"
+                )
+            # Keep only the leads that still need removing so a retry picks them up
+            failed_map_ids = set(result.failed_lead_map_ids)
+            ss.lead_details = [
+                ld for ld in ss.lead_details if ld["leadMappingId"] in failed_map_ids
+            ]
         finally:
             ss.removing = False
@@ -3,7 +3,9 @@ import pandas as pd
 import datetime
 from collections import defaultdict
 
-from clients.smartlead.index import get_campaign_top_level_analytics_for_date_range
+from clients.smartlead.analytics_cache import (
+    get_campaign_analytics_for_date_range_cached,
+)
 from common.utils import get_or_create_blob_service_client, json_to_csv
 from azure.storage.blob import ContentSettings
 
@@ -97,7 +99,7 @@ LEFT JOIN platform_organizations po ON slc."platformOrganizationId" = po.id
 
         try:
             for camp in org_campaigns:
-                analytics = get_campaign_top_level_analytics_for_date_range(
+                analytics = get_campaign_analytics_for_date_range_cached(
                     camp["campaignId"],
                     start_date=start_date,
                     end_date=end_date,
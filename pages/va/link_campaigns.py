@@ -1,6 +1,8 @@
 import streamlit as st
 from dateutil import parser
-from clients.smartlead.index import get_campaign_by_id
+from typing import Optional
+from clients.smartlead.index import get_campaign_by_id, get_campaigns_by_ids
+from clients.smartlead.schema import SmartleadCampaign
 from sqlalchemy import text
 
 
@@ -22,9 +24,11 @@ def get_platform_orgs():
 def upsert_smartlead_campaign(
     campaign_id: str,
     platform_organization_id: str,
+    smartlead_campaign: Optional[SmartleadCampaign] = None,
 ):
-    # 1. Fetch campaign from SmartLead
-    smartlead_campaign = get_campaign_by_id(int(campaign_id))
+    # 1. Fetch campaign from SmartLead (unless it was prefetched in bulk)
+    if smartlead_campaign is None:
+        smartlead_campaign = get_campaign_by_id(int(campaign_id))
 
     if not smartlead_campaign or not smartlead_campaign.created_at:
         raise RuntimeError(f"SmartLead campaign with ID {campaign_id} not found.")
@@ -112,12 +116,26 @@ if st.button("Link Campaign(s)", type="primary"):
             progress_bar = st.progress(0)
             status_text = st.empty()
 
+            status_text.text(
+                f"Fetching {len(campaign_ids)} campaign(s) from SmartLead..."
+            )
+            smartlead_campaigns, fetch_errors = get_campaigns_by_ids(
+                int(cid) for cid in campaign_ids if cid.isdigit()
+            )
+
             for idx, campaign_id in enumerate(campaign_ids):
                 try:
                     status_text.text(f"Processing campaign {campaign_id}...")
+                    if campaign_id.isdigit() and int(campaign_id) in fetch_errors:
+                        raise fetch_errors[int(campaign_id)]
                     upsert_smartlead_campaign(
                         campaign_id=campaign_id,
                         platform_organization_id=org_label_to_id[selected_org_label],
+                        smartlead_campaign=(
+                            smartlead_campaigns.get(int(campaign_id))
+                            if campaign_id.isdigit()
+                            else None
+                        ),
                     )
                     success_count += 1
                 except Exception as e:
@@ -6,7 +6,7 @@ from github import Github
 from datetime import datetime
 from bs4 import BeautifulSoup
 
-from clients.smartlead.index import get_campaigns
+from clients.smartlead.index import get_campaign_summaries
 
 
 # Constants
@@ -139,7 +139,7 @@ st.markdown("Revert a campaign template to a previous version from Git history."
 st.subheader("1. Select Campaign")
 
 with st.spinner("Loading campaigns..."):
-    campaigns = get_campaigns()
+    campaigns = get_campaign_summaries()
 
 if campaigns:
     campaign_options = {f"{c.name} (ID: {c.id})": c.id for c in campaigns}